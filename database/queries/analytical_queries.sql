@@ -251,16 +251,28 @@ ORDER BY res.grid;
 -- 9. KEY PERFORMANCE INDICATORS
 -- ============================================================
 
-SELECT 'Total Races'             AS metric, COUNT(*) AS value                                                    FROM results WHERE constructor_id = :cid
+-- One scan of results; the metrics are then unpivoted from the single aggregate row.
+WITH k AS (
+    SELECT
+        COUNT(*)                                                      AS races,
+        COUNT(CASE WHEN position = 1  THEN 1 END)                     AS wins,
+        COUNT(CASE WHEN position <= 3 THEN 1 END)                     AS podiums,
+        SUM(points)                                                   AS points,
+        AVG(CASE WHEN position_order < 999 THEN position_order END)   AS avg_finish,
+        COUNT(CASE WHEN position_order = 999 THEN 1 END)              AS dnfs
+    FROM results
+    WHERE constructor_id = :cid
+)
+SELECT 'Total Races'             AS metric, races                            AS value FROM k
 UNION ALL
-SELECT 'Total Wins',             COUNT(*)                                                                         FROM results WHERE constructor_id = :cid AND position = 1
+SELECT 'Total Wins',             wins                                               FROM k
 UNION ALL
-SELECT 'Total Podiums',          COUNT(*)                                                                         FROM results WHERE constructor_id = :cid AND position <= 3
+SELECT 'Total Podiums',          podiums                                            FROM k
 UNION ALL
-SELECT 'Total Points',           SUM(points)                                                                      FROM results WHERE constructor_id = :cid
+SELECT 'Total Points',           points                                             FROM k
 UNION ALL
-SELECT 'Avg Finish Position',    ROUND(AVG(CASE WHEN position_order < 999 THEN position_order END), 2)           FROM results WHERE constructor_id = :cid
+SELECT 'Avg Finish Position',    ROUND(avg_finish, 2)                               FROM k
 UNION ALL
-SELECT 'Win Rate %',             ROUND(COUNT(CASE WHEN position = 1 THEN 1 END) * 100.0 / COUNT(*), 2)          FROM results WHERE constructor_id = :cid
+SELECT 'Win Rate %',             ROUND(wins * 100.0 / races, 2)                     FROM k
 UNION ALL
-SELECT 'DNF Rate %',             ROUND(COUNT(CASE WHEN position_order = 999 THEN 1 END) * 100.0 / COUNT(*), 2)  FROM results WHERE constructor_id = :cid;
+SELECT 'DNF Rate %',             ROUND(dnfs * 100.0 / races, 2)                     FROM k;
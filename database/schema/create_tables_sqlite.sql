@@ -158,7 +158,7 @@ CREATE INDEX IF NOT EXISTS idx_races_year ON races(year);
 CREATE INDEX IF NOT EXISTS idx_races_circuit ON races(circuit_id);
 CREATE INDEX IF NOT EXISTS idx_results_race ON results(race_id);
 CREATE INDEX IF NOT EXISTS idx_results_driver ON results(driver_id);
-CREATE INDEX IF NOT EXISTS idx_results_constructor ON results(constructor_id);
+CREATE INDEX IF NOT EXISTS idx_results_constructor_race ON results(constructor_id, race_id);
 CREATE INDEX IF NOT EXISTS idx_qualifying_race ON qualifying(race_id);
 CREATE INDEX IF NOT EXISTS idx_qualifying_driver ON qualifying(driver_id);
 CREATE INDEX IF NOT EXISTS idx_pit_stops_race   ON pit_stops(race_id);
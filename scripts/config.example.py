@@ -31,6 +31,13 @@ DB_CONFIG = {
 #     "database": "f1_analytics",
 # }
 
+# --- Extraction ---
+# fast_dev: write raw tables as zstd Feather instead of Parquet — quicker for local
+#           iteration; Parquet stays the default for durable data.
+EXTRACTION_CONFIG = {
+    "fast_dev": False,
+}
+
 # --- Data paths ---
 DATA_PATHS = {
     "raw_data": "data/raw/",
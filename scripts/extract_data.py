@@ -1,14 +1,22 @@
 import argparse
+import gzip
+import hashlib
 import json
 import os
 import random
 import sys
+import threading
 import time
 from collections.abc import Callable, Iterator
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
+import orjson
 import pandas as pd
+import pyarrow as pa
 import requests
+from requests.adapters import HTTPAdapter
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
@@ -16,6 +24,15 @@ if SCRIPT_DIR not in sys.path:
 
 from logging_utils import setup_logging
 from constants import DEFAULT_START_YEAR, DEFAULT_END_YEAR, DNF_POSITION_ORDER
+from table_io import TABLE_FORMATS, TableWriter, count_rows, find_table, is_empty, read_table, write_table
+
+try:
+    from config import EXTRACTION_CONFIG
+except ImportError:
+    EXTRACTION_CONFIG = {}
+
+# Feather writes fastest for local iteration; parquet is the durable default.
+DEFAULT_OUTPUT_FORMAT = "feather" if EXTRACTION_CONFIG.get("fast_dev") else "parquet"
 
 
 def _safe_float(val) -> float | None:
@@ -25,15 +42,63 @@ def _safe_float(val) -> float | None:
         return None
 
 
-def _safe_int(val) -> int | None:
+def _new_columns(names: list[str]) -> dict[str, list]:
+    return {name: [] for name in names}
+
+
+def _as_category(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Store low-cardinality string columns as categoricals (dictionary-encoded in Parquet/Feather)."""
+    for col in columns:
+        # Going through "string" pins the category type even when a batch holds only nulls.
+        df[col] = df[col].astype("string").astype("category")
+    return df
+
+
+CIRCUIT_COLUMNS = ["circuit_ref", "circuit_name", "location", "country", "lat", "lng", "altitude", "url"]
+SEASON_COLUMNS = ["year", "url"]
+CONSTRUCTOR_COLUMNS = ["constructor_ref", "constructor_name", "nationality", "url"]
+DRIVER_COLUMNS = ["driver_ref", "driver_number", "code", "forename", "surname", "dob", "nationality", "url"]
+RACE_COLUMNS = ["year", "round", "race_id", "circuit_ref", "race_name", "race_date", "race_time", "url"]
+RESULT_COLUMNS = [
+    "race_id", "driver_ref", "constructor_ref", "number", "grid", "position", "position_text",
+    "position_order", "points", "laps", "time_result", "milliseconds", "fastest_lap",
+    "fastest_lap_rank", "fastest_lap_time", "fastest_lap_speed", "status",
+]
+QUALIFYING_COLUMNS = ["race_id", "driver_ref", "constructor_ref", "number", "position", "q1", "q2", "q3"]
+PIT_STOP_COLUMNS = ["race_id", "driver_ref", "stop", "lap", "time_of_day", "duration", "milliseconds"]
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date form)."""
+    if not value:
+        return None
     try:
-        return int(val) if val else None
-    except (ValueError, TypeError):
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
         return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
 
 
 class F1DataExtractor:
     BASE_URL = "https://api.jolpi.ca/ergast/f1"
+    USER_AGENT = "redbullracing-f1-analytics (+https://github.com/Felixsavedra-1/redbullracing-f1-analytics)"
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 32
+    # List-valued key inside each MRData table, per the Ergast schema.
+    _INNER = {
+        "CircuitTable": "Circuits",
+        "ConstructorTable": "Constructors",
+        "DriverTable": "Drivers",
+        "RaceTable": "Races",
+        "SeasonTable": "Seasons",
+        "StandingsTable": "StandingsLists",
+    }
 
     def __init__(
         self,
@@ -44,47 +109,91 @@ class F1DataExtractor:
         max_base_delay: float = 8.0,
         timeout: int = 30,
         circuit_breaker_limit: int | None = 50,
+        max_workers: int = 4,
+        output_format: str = DEFAULT_OUTPUT_FORMAT,
+        use_cache: bool = True,
     ):
+        if output_format not in TABLE_FORMATS:
+            raise ValueError(f"output_format must be one of {', '.join(TABLE_FORMATS)}; got {output_format!r}")
         self.output_path = output_path
+        self.output_format = output_format
+        self.use_cache = use_cache
         base_dir = os.path.dirname(os.path.normpath(output_path)) or "."
         self.cache_path = os.path.join(base_dir, "cache")
+        self.http_cache_path = os.path.join(self.cache_path, "http")
         self.base_delay = base_delay
+        self.min_delay = base_delay
         self.max_retries = max_retries
         self.max_backoff = max_backoff
         self.max_base_delay = max_base_delay
         self.timeout = timeout
         self.circuit_breaker_limit = circuit_breaker_limit
-        self.session = requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.session = self._build_session()
         self._last_request_ts = 0.0
+        self._rate_lock = threading.Lock()
         self._consecutive_rate_limits = 0
         self._total_rate_limits = 0
         self.logger = setup_logging()
         os.makedirs(output_path, exist_ok=True)
         os.makedirs(self.cache_path, exist_ok=True)
+        os.makedirs(self.http_cache_path, exist_ok=True)
+
+    def _build_session(self) -> requests.Session:
+        # Keep-alive pool so paginated calls reuse one TLS connection instead of handshaking per request.
+        # Retries stay in _make_request, where 429s feed the adaptive delay and circuit breaker.
+        session = requests.Session()
+        # Ergast payloads repeat the same keys on every row and compress 5-10x. Advertise every
+        # encoding urllib3 can decode here (gzip/deflate, plus br/zstd when their libraries are
+        # installed) — naming one it cannot decode would hand back undecoded bytes.
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+            "User-Agent": self.USER_AGENT,
+        })
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        self.session.close()
 
     def _backoff(self, attempt: int, retry_after: str | None) -> None:
-        if retry_after:
-            try:
-                delay = float(retry_after)
-            except ValueError:
-                delay = self.base_delay
-        else:
-            delay = min(self.base_delay * (2 ** attempt), self.max_backoff)
-        if retry_after:
-            self.base_delay = min(max(self.base_delay, delay), self.max_base_delay)
-        else:
-            self.base_delay = min(self.base_delay * 1.25, self.max_base_delay)
-        jitter = random.uniform(0, min(0.25, self.base_delay))
+        # base_delay is shared with the other worker threads; read and grow it in one step.
+        with self._rate_lock:
+            if retry_after:
+                delay = _parse_retry_after(retry_after)
+                if delay is None:
+                    delay = self.base_delay
+            else:
+                delay = min(self.base_delay * (2 ** attempt), self.max_backoff)
+            if retry_after:
+                self.base_delay = min(max(self.base_delay, delay), self.max_base_delay)
+            else:
+                self.base_delay = min(self.base_delay * 1.25, self.max_base_delay)
+            base_delay = self.base_delay
+        jitter = random.uniform(0, min(0.25, base_delay))
         wait_for = delay + jitter
-        self.logger.info("Backoff %.1fs (base_delay=%.2fs)", wait_for, self.base_delay)
+        self.logger.info("Backoff %.1fs (base_delay=%.2fs)", wait_for, base_delay)
         time.sleep(wait_for)
     
     def _rate_limit(self) -> None:
-        now = time.time()
-        elapsed = now - self._last_request_ts
-        if elapsed < self.base_delay:
-            time.sleep(self.base_delay - elapsed)
-        self._last_request_ts = time.time()
+        # Reserve the next send slot under the lock, then sleep outside it, so worker
+        # threads share one request budget instead of each pacing independently.
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._last_request_ts + self.base_delay)
+            self._last_request_ts = send_at
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def _relax_delay(self) -> None:
+        # The delay only grows in response to 429s; ease it back toward the configured
+        # floor once requests succeed again so one burst does not slow the whole run.
+        with self._rate_lock:
+            if self.base_delay > self.min_delay:
+                self.base_delay = max(self.min_delay, self.base_delay * 0.9)
 
     def _get_total(self, json_data: dict | None) -> int:
         if not json_data:
@@ -114,78 +223,142 @@ class F1DataExtractor:
             pass
         return None
 
-    def _output_file_empty(self, filename: str) -> bool:
-        path = os.path.join(self.output_path, filename)
-        return not os.path.exists(path) or os.path.getsize(path) < 10
+    def _output_file_empty(self, table: str) -> bool:
+        return is_empty(find_table(self.output_path, table))
 
-    def _output_has_rows(self, filename: str) -> bool:
-        path = os.path.join(self.output_path, filename)
-        if not os.path.exists(path):
-            return False
+    def _output_has_rows(self, table: str) -> bool:
+        return self._count_rows(table) > 0
+
+    def _count_rows(self, table: str) -> int:
+        return count_rows(find_table(self.output_path, table))
+
+    def _write_table(self, df: pd.DataFrame, table: str) -> None:
+        write_table(df, self.output_path, table, self.output_format)
+        if not len(df.columns):
+            self.logger.warning("%s was written but appears empty.", table)
+
+    def _page_cache_path(self, url: str) -> str:
+        return os.path.join(self.http_cache_path, hashlib.sha1(url.encode()).hexdigest())
+
+    def _read_cached_page(self, url: str) -> tuple[str | None, dict | None]:
+        """Return (etag, payload) stored for ``url``; either is None when absent or unreadable."""
+        if not self.use_cache:
+            return None, None
+        base = self._page_cache_path(url)
         try:
-            with open(path, "r") as handle:
-                handle.readline()
-                return bool(handle.readline())
+            with gzip.open(f"{base}.json.gz", "rb") as handle:
+                data = orjson.loads(handle.read())
+        except (OSError, EOFError, orjson.JSONDecodeError):
+            return None, None
+        try:
+            with open(f"{base}.etag", "r") as handle:
+                etag = handle.read().strip() or None
         except OSError:
-            return False
+            etag = None
+        return etag, data
 
-    def _count_rows(self, filename: str) -> int:
-        path = os.path.join(self.output_path, filename)
-        if not os.path.exists(path):
-            return 0
+    def _write_cached_page(self, url: str, body: bytes, etag: str | None) -> None:
+        base = self._page_cache_path(url)
         try:
-            with open(path, "r") as handle:
-                count = -1
-                for count, _ in enumerate(handle):
-                    pass
-                return max(count, 0)
+            with gzip.open(f"{base}.json.gz.tmp", "wb") as handle:
+                handle.write(body)
+            os.replace(f"{base}.json.gz.tmp", f"{base}.json.gz")
+            if etag:
+                with open(f"{base}.etag.tmp", "w") as handle:
+                    handle.write(etag)
+                os.replace(f"{base}.etag.tmp", f"{base}.etag")
+            elif os.path.exists(f"{base}.etag"):
+                os.remove(f"{base}.etag")
+        except OSError as exc:
+            self.logger.debug("Could not cache %s: %s", url, exc)
+
+    def _cached_page_fetched_at(self, url: str) -> float | None:
+        """When the cached page for ``url`` was last fetched or revalidated (its mtime), or None."""
+        try:
+            return os.path.getmtime(f"{self._page_cache_path(url)}.json.gz")
         except OSError:
-            return 0
+            return None
 
-    def _write_csv_atomic(self, df: pd.DataFrame, filename: str) -> None:
-        path = os.path.join(self.output_path, filename)
-        tmp_path = f"{path}.tmp"
-        df.to_csv(tmp_path, index=False)
-        os.replace(tmp_path, path)
-        if os.path.getsize(path) < 10:
-            self.logger.warning("%s was written but appears empty.", filename)
+    def _touch_cached_page(self, url: str) -> None:
+        # A 304 confirms the cached body is current as of now; record that as its fetch time.
+        try:
+            os.utime(f"{self._page_cache_path(url)}.json.gz")
+        except OSError as exc:
+            self.logger.debug("Could not touch cache for %s: %s", url, exc)
+
+    @staticmethod
+    def _is_settled(endpoint: str, fetched_at: float | None) -> bool:
+        """True for endpoints scoped to a season that had already finished when the page was fetched.
+
+        A page cached mid-season (standings after round 5, a race not yet run) stays unsettled
+        and is revalidated until it has been fetched in a later year than its season.
+        """
+        season = endpoint.split("/", 1)[0]
+        if not season.isdigit() or fetched_at is None:
+            return False
+        return int(season) < datetime.fromtimestamp(fetched_at).year
 
     def _make_request(self, endpoint: str, limit: int = 1000, offset: int = 0) -> dict | None:
         url = f"{self.BASE_URL}/{endpoint}.json?limit={limit}&offset={offset}"
+        # Revalidate pages fetched on a previous run: a 304 carries no body and costs the server nothing.
+        cached_etag, cached_data = self._read_cached_page(url)
+        if cached_data is not None and self._is_settled(endpoint, self._cached_page_fetched_at(url)):
+            # Finished seasons never change; serve them from disk without touching the network.
+            return cached_data
+        headers = {"If-None-Match": cached_etag} if cached_etag else None
 
         for attempt in range(self.max_retries):
             try:
                 self._rate_limit()
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout, headers=headers)
+                if response.status_code == 304 and cached_data is not None:
+                    with self._rate_lock:
+                        self._consecutive_rate_limits = 0
+                    self._touch_cached_page(url)
+                    return cached_data
                 if response.status_code == 429:
                     retry_after = response.headers.get("Retry-After")
-                    self._consecutive_rate_limits += 1
-                    self._total_rate_limits += 1
-                    if self.circuit_breaker_limit and self._total_rate_limits >= self.circuit_breaker_limit:
+                    # Worker threads share these counters and the delay; update them as one step.
+                    with self._rate_lock:
+                        self._consecutive_rate_limits += 1
+                        self._total_rate_limits += 1
+                        total_rate_limits = self._total_rate_limits
+                        if self._consecutive_rate_limits >= 3:
+                            self.base_delay = min(self.base_delay * 1.5, self.max_base_delay)
+                    if self.circuit_breaker_limit and total_rate_limits >= self.circuit_breaker_limit:
                         raise RuntimeError(
-                            f"Circuit breaker: {self._total_rate_limits} rate limit responses received. "
+                            f"Circuit breaker: {total_rate_limits} rate limit responses received. "
                             "Increase --base-delay or try again later."
                         )
                     self.logger.info(
                         "Rate limited on %s (total: %s); retrying...",
-                        endpoint, self._total_rate_limits,
+                        endpoint, total_rate_limits,
                     )
-                    if self._consecutive_rate_limits >= 3:
-                        self.base_delay = min(self.base_delay * 1.5, self.max_base_delay)
                     self._backoff(attempt, retry_after)
                     continue
                 if response.status_code in {400, 404}:
                     self.logger.warning("Invalid request for %s: %s. Skipping.", endpoint, response.status_code)
                     return None
                 response.raise_for_status()
-                self._consecutive_rate_limits = 0
-                return response.json()
-            except requests.exceptions.RequestException as e:
+                with self._rate_lock:
+                    self._consecutive_rate_limits = 0
+                self._relax_delay()
+                data = orjson.loads(response.content)
+                self._write_cached_page(url, response.content, response.headers.get("ETag"))
+                return data
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
                 self.logger.warning("Error fetching %s: %s", endpoint, e)
                 self._backoff(attempt, None)
 
         self.logger.error("Failed to fetch %s after %s retries.", endpoint, self.max_retries)
         return None
+
+    def _fetch_many(self, endpoints: list[str], limit: int = 1000) -> list[dict | None]:
+        """Fetch single-page endpoints concurrently; results keep the order of ``endpoints``."""
+        if self.max_workers == 1 or len(endpoints) < 2:
+            return [self._make_request(ep, limit=limit, offset=0) for ep in endpoints]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(endpoints))) as pool:
+            return list(pool.map(lambda ep: self._make_request(ep, limit=limit, offset=0), endpoints))
     
     def _extract_table(self, json_data: dict, table_name: str) -> list[dict]:
         if not json_data or 'MRData' not in json_data:
@@ -200,7 +373,11 @@ class F1DataExtractor:
                     break
         if not table_data:
             return []
-        
+
+        records = table_data.get(self._INNER.get(table_name, ""))
+        if isinstance(records, list):
+            return records
+        # Unknown table or renamed key: fall back to the first list-valued field.
         for key, value in table_data.items():
             if isinstance(value, list):
                 return value
@@ -208,92 +385,90 @@ class F1DataExtractor:
         return []
     
     def _paginate(
-        self, endpoint: str, table_key: str, limit: int = 100
+        self, endpoint: str, table_key: str, limit: int = 1000, first_page: dict | None = None
     ) -> Iterator[list]:
+        # Ask for the largest page the API allows, but step by what actually came back:
+        # mirrors may cap ``limit`` lower, so a short page does not mean the end.
+        # ``first_page`` lets callers that prefetched offset 0 concurrently skip that request.
         offset = 0
         while True:
-            data = self._make_request(endpoint, limit=limit, offset=offset)
+            if offset == 0 and first_page is not None:
+                data = first_page
+            else:
+                data = self._make_request(endpoint, limit=limit, offset=offset)
             if not data:
                 break
             records = self._extract_table(data, table_key) or []
             if not records:
                 break
             yield records
-            if len(records) < limit:
+            offset += len(records)
+            if offset >= self._get_total(data):
                 break
-            offset += limit
 
     def extract_circuits(self) -> pd.DataFrame:
         self.logger.info("Extracting circuits...")
-        all_circuits = []
-        for circuits in self._paginate("circuits", "CircuitsTable"):
+        cols = _new_columns(CIRCUIT_COLUMNS)
+        for circuits in self._paginate("circuits", "CircuitTable"):
             for circuit in circuits:
                 location = circuit.get('Location', {})
-                all_circuits.append({
-                    'circuit_ref': circuit.get('circuitId', ''),
-                    'circuit_name': circuit.get('circuitName', ''),
-                    'location': location.get('locality', ''),
-                    'country': location.get('country', ''),
-                    'lat': _safe_float(location.get('lat')),
-                    'lng': _safe_float(location.get('long')),
-                    'altitude': None,
-                    'url': circuit.get('url', ''),
-                })
-        df = pd.DataFrame(all_circuits)
-        df.to_csv(os.path.join(self.output_path, "circuits.csv"), index=False)
+                cols['circuit_ref'].append(circuit.get('circuitId', ''))
+                cols['circuit_name'].append(circuit.get('circuitName', ''))
+                cols['location'].append(location.get('locality', ''))
+                cols['country'].append(location.get('country', ''))
+                cols['lat'].append(_safe_float(location.get('lat')))
+                cols['lng'].append(_safe_float(location.get('long')))
+                cols['altitude'].append(None)
+                cols['url'].append(circuit.get('url', ''))
+        df = pd.DataFrame(cols)
+        self._write_table(df, "circuits")
         self.logger.info("Extracted %s circuits.", len(df))
         return df
     
     def extract_seasons(self) -> pd.DataFrame:
         self.logger.info("Extracting seasons...")
-        all_seasons = []
+        cols = _new_columns(SEASON_COLUMNS)
         for seasons in self._paginate("seasons", "SeasonTable"):
             for season in seasons:
-                all_seasons.append({
-                    "year": int(season.get("season", 0)),
-                    "url": season.get("url", ""),
-                })
-        df = pd.DataFrame(all_seasons)
-        df.to_csv(os.path.join(self.output_path, "seasons.csv"), index=False)
+                cols["year"].append(int(season.get("season", 0)))
+                cols["url"].append(season.get("url", ""))
+        df = pd.DataFrame(cols)
+        self._write_table(df, "seasons")
         self.logger.info("Extracted %s seasons.", len(df))
         return df
     
     def extract_constructors(self) -> pd.DataFrame:
         self.logger.info("Extracting constructors...")
-        all_constructors = []
+        cols = _new_columns(CONSTRUCTOR_COLUMNS)
         for constructors in self._paginate("constructors", "ConstructorTable"):
             for constructor in constructors:
-                all_constructors.append({
-                    'constructor_ref': constructor.get('constructorId', ''),
-                    'constructor_name': constructor.get('name', ''),
-                    'nationality': constructor.get('nationality', ''),
-                    'url': constructor.get('url', ''),
-                })
-        df = pd.DataFrame(all_constructors)
+                cols['constructor_ref'].append(constructor.get('constructorId', ''))
+                cols['constructor_name'].append(constructor.get('name', ''))
+                cols['nationality'].append(constructor.get('nationality', ''))
+                cols['url'].append(constructor.get('url', ''))
+        df = _as_category(pd.DataFrame(cols), ["nationality"])
         df.insert(0, "constructor_id", range(1, len(df) + 1))
-        df.to_csv(os.path.join(self.output_path, "constructors.csv"), index=False)
+        self._write_table(df, "constructors")
         self.logger.info("Extracted %s constructors.", len(df))
         return df
     
     def extract_drivers(self) -> pd.DataFrame:
         self.logger.info("Extracting drivers...")
-        all_drivers = []
+        cols = _new_columns(DRIVER_COLUMNS)
         for drivers in self._paginate("drivers", "DriverTable"):
             for driver in drivers:
                 dob = driver.get('dateOfBirth', '')
-                all_drivers.append({
-                    'driver_ref': driver.get('driverId', ''),
-                    'driver_number': None,
-                    'code': driver.get('code', ''),
-                    'forename': driver.get('givenName', ''),
-                    'surname': driver.get('familyName', ''),
-                    'dob': dob if dob else None,
-                    'nationality': driver.get('nationality', ''),
-                    'url': driver.get('url', ''),
-                })
-        df = pd.DataFrame(all_drivers)
+                cols['driver_ref'].append(driver.get('driverId', ''))
+                cols['driver_number'].append(None)
+                cols['code'].append(driver.get('code', ''))
+                cols['forename'].append(driver.get('givenName', ''))
+                cols['surname'].append(driver.get('familyName', ''))
+                cols['dob'].append(dob if dob else None)
+                cols['nationality'].append(driver.get('nationality', ''))
+                cols['url'].append(driver.get('url', ''))
+        df = _as_category(pd.DataFrame(cols), ["nationality"])
         df.insert(0, "driver_id", range(1, len(df) + 1))
-        df.to_csv(os.path.join(self.output_path, "drivers.csv"), index=False)
+        self._write_table(df, "drivers")
         self.logger.info("Extracted %s drivers.", len(df))
         return df
     
@@ -301,23 +476,22 @@ class F1DataExtractor:
         self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR
     ) -> pd.DataFrame:
         self.logger.info("Extracting races (%s-%s)...", start_year, end_year)
-        all_races = []
+        cols = _new_columns(RACE_COLUMNS)
         for year in range(start_year, end_year + 1):
             for races in self._paginate(f"{year}/races", "RaceTable"):
                 for race in races:
                     circuit = race.get('Circuit', {})
-                    all_races.append({
-                        'year': year,
-                        'round': int(race.get('round', 0)),
-                        'race_id': int(f"{year}{int(race.get('round', 0)):02d}"),
-                        'circuit_ref': circuit.get('circuitId', ''),
-                        'race_name': race.get('raceName', ''),
-                        'race_date': race.get('date', ''),
-                        'race_time': race.get('time', '00:00:00Z').replace('Z', ''),
-                        'url': race.get('url', ''),
-                    })
-        df = pd.DataFrame(all_races)
-        self._write_csv_atomic(df, "races.csv")
+                    round_num = int(race.get('round', 0))
+                    cols['year'].append(year)
+                    cols['round'].append(round_num)
+                    cols['race_id'].append(year * 100 + round_num)
+                    cols['circuit_ref'].append(circuit.get('circuitId', ''))
+                    cols['race_name'].append(race.get('raceName', ''))
+                    cols['race_date'].append(race.get('date', ''))
+                    cols['race_time'].append(race.get('time', '00:00:00Z').replace('Z', ''))
+                    cols['url'].append(race.get('url', ''))
+        df = pd.DataFrame(cols)
+        self._write_table(df, "races")
         self.logger.info("Extracted %s races.", len(df))
         return df
     
@@ -328,158 +502,195 @@ class F1DataExtractor:
         rounds_by_year: dict[int, list[int]],
         endpoint: str,
         progress_file: str,
-        output_file: str,
-        parse_race: Callable,  # (race_dict, race_id) -> list[dict]
+        output_table: str,
+        parse_race: Callable,  # (race_dict, race_id, cols) -> None; appends to cols
+        columns: list[str],
         label: str,
         min_rows_per_race: int = 0,
-    ) -> list[dict]:
-        rows: list[dict] = []
+        finalize: Callable | None = None,  # (df) -> df; applied to each year's batch before writing
+    ) -> int:
+        """Fetch pending rounds and stream one batch per year to ``output_table``; returns rows written."""
         progress = self._load_progress(progress_file, start_year, end_year)
-        races_count = sum(len(rounds_by_year.get(y) or []) for y in range(start_year, end_year + 1))
+        # Only rounds recorded as fetched are expected on disk; newly scheduled ones are still pending.
+        races_count = sum(len(rounds) for rounds in progress.get("years", {}).values())
 
-        if self._output_file_empty(output_file) or not self._output_has_rows(output_file):
-            self.logger.warning("%s is missing or empty; rebuilding extraction state.", output_file)
+        # Rows already on disk for finished rounds are carried into the rewritten table.
+        existing_path = find_table(self.output_path, output_table)
+        if self._output_file_empty(output_table) or not self._output_has_rows(output_table):
+            self.logger.warning("%s is missing or empty; rebuilding extraction state.", output_table)
             progress = {"years": {}, "skipped": {}}
+            existing_path = None
         elif min_rows_per_race and races_count:
-            row_count = self._count_rows(output_file)
+            row_count = self._count_rows(output_table)
             if row_count < races_count * min_rows_per_race:
                 self.logger.warning(
                     "%s looks incomplete (%s rows for %s races); rebuilding.",
-                    output_file, row_count, races_count,
+                    output_table, row_count, races_count,
                 )
                 progress = {"years": {}, "skipped": {}}
+                existing_path = None
 
-        for year in range(start_year, end_year + 1):
-            rounds = rounds_by_year.get(year) or list(range(1, 25))
-            progress_years = progress.get("years", {})
-            progress_skipped = progress.get("skipped", {})
-            done_rounds = set(progress_years.get(str(year), [])) | set(progress_skipped.get(str(year), []))
-            total = len(rounds)
-
-            for round_num in rounds:
-                if round_num in done_rounds:
+        current_year = datetime.now().year
+        with TableWriter(self.output_path, output_table, self.output_format, columns) as writer:
+            for year in range(start_year, end_year + 1):
+                rounds = rounds_by_year.get(year) or list(range(1, 25))
+                progress_years = progress.get("years", {})
+                progress_skipped = progress.get("skipped", {})
+                fetched_rounds = set(progress_years.get(str(year), []))
+                done_rounds = set(fetched_rounds)
+                # An empty round in the running season may just not have been raced yet; ask again.
+                if year < current_year:
+                    done_rounds |= set(progress_skipped.get(str(year), []))
+                total = len(rounds)
+
+                carried = self._read_done_rows(existing_path, year, fetched_rounds)
+                if carried is not None and len(carried):
+                    writer.write(finalize(carried) if finalize else carried)
+
+                pending = [r for r in rounds if r not in done_rounds]
+                if not pending:
                     continue
-                self.logger.info("%s %s R%s/%s", label, year, round_num, total)
-                data = self._make_request(endpoint.format(year=year, round=round_num), limit=1000, offset=0)
-                races = self._extract_table(data, "RaceTable") if data else []
-
-                if not races:
-                    progress_skipped.setdefault(str(year), [])
-                    progress_skipped[str(year)] = sorted(set(progress_skipped[str(year)] + [round_num]))
-                else:
-                    for race in races:
-                        race_id = int(f"{year}{int(race.get('round', round_num)):02d}")
-                        rows.extend(parse_race(race, race_id))
-                    progress_years.setdefault(str(year), [])
-                    progress_years[str(year)] = sorted(set(progress_years[str(year)] + [round_num]))
-
+                self.logger.info("%s %s: fetching %s/%s rounds", label, year, len(pending), total)
+                responses = self._fetch_many([endpoint.format(year=year, round=r) for r in pending])
+
+                cols = _new_columns(columns)
+                for round_num, data in zip(pending, responses):
+                    races = self._extract_table(data, "RaceTable") if data else []
+
+                    if not races:
+                        progress_skipped.setdefault(str(year), [])
+                        progress_skipped[str(year)] = sorted(set(progress_skipped[str(year)] + [round_num]))
+                    else:
+                        for race in races:
+                            race_id = year * 100 + int(race.get('round', round_num))
+                            parse_race(race, race_id, cols)
+                        progress_years.setdefault(str(year), [])
+                        progress_years[str(year)] = sorted(set(progress_years[str(year)] + [round_num]))
+
+                # Flush the whole season at once so memory holds one year of rows, not the full range.
+                # Batches that need no pandas-side casting go from column lists straight to Arrow.
+                writer.write(finalize(pd.DataFrame(cols)) if finalize else pa.table(cols))
                 self._save_progress(progress_file, progress, start_year, end_year)
 
-        return rows
+        return writer.rows
+
+    @staticmethod
+    def _read_done_rows(path: str | None, year: int, rounds: set[int]) -> pd.DataFrame | None:
+        """Rows of ``year`` already extracted to ``path`` for the given rounds."""
+        if path is None or not rounds:
+            return None
+        df = read_table(path, filters=[("race_id", ">=", year * 100), ("race_id", "<", (year + 1) * 100)])
+        return df[(df["race_id"] % 100).isin(rounds)]
 
-    def _parse_results_race(self, race: dict, race_id: int) -> list[dict]:
+    def _parse_results_race(self, race: dict, race_id: int, cols: dict[str, list]) -> None:
         results = race.get("Results", [])
         if not isinstance(results, list):
             results = [results]
-        rows = []
         for result in results:
             driver = result.get("Driver", {})
             constructor = result.get("Constructor", {})
             fastest_lap = result.get("FastestLap", {})
-            position = result.get("position", "")
-            rows.append({
-                "race_id": race_id,
-                "driver_ref": driver.get("driverId", ""),
-                "constructor_ref": constructor.get("constructorId", ""),
-                "number": _safe_int(result.get("number")),
-                "grid": _safe_int(result.get("grid")),
-                "position": int(position) if position.isdigit() else None,
-                "position_text": result.get("positionText", ""),
-                "position_order": int(position) if position.isdigit() else DNF_POSITION_ORDER,
-                "points": float(result.get("points", 0)),
-                "laps": int(result.get("laps", 0)) if result.get("laps") else None,
-                "time_result": result.get("Time", {}).get("time", "") if result.get("Time") else None,
-                "milliseconds": int(result["Time"]["millis"]) if result.get("Time", {}).get("millis") else None,
-                "fastest_lap": int(fastest_lap.get("lap", 0)) if fastest_lap.get("lap") else None,
-                "fastest_lap_rank": int(fastest_lap.get("rank", 0)) if fastest_lap.get("rank") else None,
-                "fastest_lap_time": fastest_lap.get("Time", {}).get("time", "") if fastest_lap.get("Time") else None,
-                "fastest_lap_speed": fastest_lap.get("AverageSpeed", {}).get("speed", "") if fastest_lap.get("AverageSpeed") else None,
-                "status": result.get("status", "Finished"),
-            })
-        return rows
-
-    def _parse_qualifying_race(self, race: dict, race_id: int) -> list[dict]:
+            # Numeric fields stay raw strings here; _cast_results converts whole columns at once.
+            cols["race_id"].append(race_id)
+            cols["driver_ref"].append(driver.get("driverId", ""))
+            cols["constructor_ref"].append(constructor.get("constructorId", ""))
+            cols["number"].append(result.get("number"))
+            cols["grid"].append(result.get("grid"))
+            cols["position"].append(result.get("position"))
+            cols["position_text"].append(result.get("positionText", ""))
+            cols["position_order"].append(None)
+            cols["points"].append(result.get("points"))
+            cols["laps"].append(result.get("laps"))
+            cols["time_result"].append(result.get("Time", {}).get("time", "") if result.get("Time") else None)
+            cols["milliseconds"].append(result.get("Time", {}).get("millis"))
+            cols["fastest_lap"].append(fastest_lap.get("lap"))
+            cols["fastest_lap_rank"].append(fastest_lap.get("rank"))
+            cols["fastest_lap_time"].append(
+                fastest_lap.get("Time", {}).get("time", "") if fastest_lap.get("Time") else None
+            )
+            cols["fastest_lap_speed"].append(
+                fastest_lap.get("AverageSpeed", {}).get("speed", "") if fastest_lap.get("AverageSpeed") else None
+            )
+            cols["status"].append(result.get("status", "Finished"))
+
+    @staticmethod
+    def _cast_results(df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the raw string fields of a results frame column-wise; unparseable values become NA."""
+        for col in ["number", "grid", "position", "laps", "milliseconds", "fastest_lap", "fastest_lap_rank"]:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+        df["points"] = pd.to_numeric(df["points"], errors="coerce").fillna(0).astype("float32")
+        df["position_order"] = df["position"].fillna(DNF_POSITION_ORDER).astype("Int64")
+        return _as_category(df, ["driver_ref", "constructor_ref", "status"])
+
+    @staticmethod
+    def _cast_standings(df: pd.DataFrame, ref_field: str) -> pd.DataFrame:
+        df["points"] = pd.to_numeric(df["points"], errors="coerce").fillna(0).astype("float32")
+        df["position"] = pd.to_numeric(df["position"], errors="coerce").astype("Int64")
+        df["wins"] = pd.to_numeric(df["wins"], errors="coerce").fillna(0).astype("Int64")
+        return _as_category(df, [ref_field])
+
+    def _parse_qualifying_race(self, race: dict, race_id: int, cols: dict[str, list]) -> None:
         qualifying_results = race.get("QualifyingResults", [])
         if not isinstance(qualifying_results, list):
             qualifying_results = [qualifying_results]
-        rows = []
         for q in qualifying_results:
             driver = q.get("Driver", {})
             constructor = q.get("Constructor", {})
-            rows.append({
-                "race_id": race_id,
-                "driver_ref": driver.get("driverId", ""),
-                "constructor_ref": constructor.get("constructorId", ""),
-                "number": int(q.get("number", 0)) if q.get("number") else None,
-                "position": int(q.get("position", 0)) if q.get("position") else None,
-                "q1": q.get("Q1", ""),
-                "q2": q.get("Q2", ""),
-                "q3": q.get("Q3", ""),
-            })
-        return rows
-
-    def _parse_pit_stops_race(self, race: dict, race_id: int) -> list[dict]:
+            cols["race_id"].append(race_id)
+            cols["driver_ref"].append(driver.get("driverId", ""))
+            cols["constructor_ref"].append(constructor.get("constructorId", ""))
+            cols["number"].append(int(q.get("number", 0)) if q.get("number") else None)
+            cols["position"].append(int(q.get("position", 0)) if q.get("position") else None)
+            cols["q1"].append(q.get("Q1", ""))
+            cols["q2"].append(q.get("Q2", ""))
+            cols["q3"].append(q.get("Q3", ""))
+
+    def _parse_pit_stops_race(self, race: dict, race_id: int, cols: dict[str, list]) -> None:
         pit_stops = race.get("PitStops", [])
         if not isinstance(pit_stops, list):
             pit_stops = [pit_stops]
-        rows = []
         for pit_stop in pit_stops:
             duration = pit_stop.get("duration", "")
-            rows.append({
-                "race_id": race_id,
-                "driver_ref": pit_stop.get("driverId", ""),
-                "stop": int(pit_stop.get("stop", 0)),
-                "lap": int(pit_stop.get("lap", 0)),
-                "time_of_day": pit_stop.get("time", ""),
-                "duration": duration,
-                "milliseconds": self._parse_duration_ms(duration),
-            })
-        return rows
-
-    def extract_results(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> pd.DataFrame:
+            cols["race_id"].append(race_id)
+            cols["driver_ref"].append(pit_stop.get("driverId", ""))
+            cols["stop"].append(int(pit_stop.get("stop", 0)))
+            cols["lap"].append(int(pit_stop.get("lap", 0)))
+            cols["time_of_day"].append(pit_stop.get("time", ""))
+            cols["duration"].append(duration)
+            cols["milliseconds"].append(self._parse_duration_ms(duration))
+
+    def extract_results(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> int:
         self.logger.info("Extracting results (%s-%s)...", start_year, end_year)
         rounds_by_year = self._get_rounds_by_year(start_year, end_year)
         rows = self._extract_per_round(
             start_year, end_year, rounds_by_year,
             endpoint="{year}/{round}/results",
             progress_file="results_progress.json",
-            output_file="results.csv",
+            output_table="results",
             parse_race=self._parse_results_race,
+            columns=RESULT_COLUMNS,
             label="Results",
             min_rows_per_race=10,
+            finalize=self._cast_results,
         )
-        df = pd.DataFrame(rows)
-        self._write_csv_atomic(df, "results.csv")
-        self.logger.info("Extracted %s results.", len(df))
-        return df
+        self.logger.info("Extracted %s results.", rows)
+        return rows
 
-    def extract_qualifying(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> pd.DataFrame:
+    def extract_qualifying(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> int:
         self.logger.info("Extracting qualifying (%s-%s)...", start_year, end_year)
         rounds_by_year = self._get_rounds_by_year(start_year, end_year)
         rows = self._extract_per_round(
             start_year, end_year, rounds_by_year,
             endpoint="{year}/{round}/qualifying",
             progress_file="qualifying_progress.json",
-            output_file="qualifying.csv",
+            output_table="qualifying",
             parse_race=self._parse_qualifying_race,
+            columns=QUALIFYING_COLUMNS,
             label="Qualifying",
             min_rows_per_race=10,
         )
-        qualifying_columns = ["race_id", "driver_ref", "constructor_ref", "number", "position", "q1", "q2", "q3"]
-        df = pd.DataFrame(rows, columns=qualifying_columns)
-        self._write_csv_atomic(df, "qualifying.csv")
-        self.logger.info("Extracted %s qualifying results.", len(df))
-        return df
+        self.logger.info("Extracted %s qualifying results.", rows)
+        return rows
     
     def _normalize_progress(
         self, data: dict, start_year: int, end_year: int
@@ -545,7 +756,7 @@ class F1DataExtractor:
             json.dump(payload, handle, indent=2, sort_keys=True)
         os.replace(tmp_path, path)
 
-    def extract_pit_stops(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> pd.DataFrame:
+    def extract_pit_stops(self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR) -> int:
         # Pit stop data is only available from 2012 onward in the Ergast API.
         self.logger.info("Extracting pit stops (%s-%s)...", start_year, end_year)
         rounds_by_year = self._get_rounds_by_year(start_year, end_year)
@@ -553,22 +764,20 @@ class F1DataExtractor:
             start_year, end_year, rounds_by_year,
             endpoint="{year}/{round}/pitstops",
             progress_file="pit_stops_progress.json",
-            output_file="pit_stops.csv",
+            output_table="pit_stops",
             parse_race=self._parse_pit_stops_race,
+            columns=PIT_STOP_COLUMNS,
             label="Pit stops",
         )
-        pit_stop_columns = ["race_id", "driver_ref", "stop", "lap", "time_of_day", "duration", "milliseconds"]
-        df = pd.DataFrame(rows, columns=pit_stop_columns)
-        self._write_csv_atomic(df, "pit_stops.csv")
-        self.logger.info("Extracted %s pit stops.", len(df))
-        return df
+        self.logger.info("Extracted %s pit stops.", rows)
+        return rows
     
     def _get_rounds_by_year(self, start_year: int, end_year: int) -> dict[int, list[int]]:
-        races_path = os.path.join(self.output_path, "races.csv")
-        if not os.path.exists(races_path):
+        races_path = find_table(self.output_path, "races")
+        if races_path is None:
             return {}
         try:
-            races_df = pd.read_csv(races_path)
+            races_df = read_table(races_path)
             rounds_by_year: dict[int, list[int]] = {}
             for year in range(start_year, end_year + 1):
                 year_rounds = races_df[races_df["year"] == year]["round"].dropna().astype(int).tolist()
@@ -586,44 +795,52 @@ class F1DataExtractor:
         entity_key: str,
         ref_field: str,
         id_attr: str,
-    ) -> list[dict]:
-        rows: list[dict] = []
+        first_pages: dict[int, dict | None],
+    ) -> dict[str, list]:
+        cols = _new_columns(["race_id", ref_field, "points", "position", "position_text", "wins"])
         for year in range(start_year, end_year + 1):
-            for batch in self._paginate(f"{year}/{endpoint}", "StandingsTable", limit=1000):
+            for batch in self._paginate(f"{year}/{endpoint}", "StandingsTable", first_page=first_pages.get(year)):
                 for sl in batch:
                     round_num = int(sl.get("round", 0) or 0)
                     if not round_num:
                         continue
-                    race_id = int(f"{year}{round_num:02d}")
+                    race_id = year * 100 + round_num
                     entries = sl.get(entries_key, [])
                     if not isinstance(entries, list):
                         entries = [entries]
                     for entry in entries:
                         entity = entry.get(entity_key, {})
-                        rows.append({
-                            "race_id": race_id,
-                            ref_field: entity.get(id_attr, ""),
-                            "points": float(entry.get("points", 0)),
-                            "position": int(entry.get("position", 0)),
-                            "position_text": entry.get("positionText", ""),
-                            "wins": int(entry.get("wins", 0)),
-                        })
-        return rows
+                        cols["race_id"].append(race_id)
+                        cols[ref_field].append(entity.get(id_attr, ""))
+                        cols["points"].append(entry.get("points"))
+                        cols["position"].append(entry.get("position"))
+                        cols["position_text"].append(entry.get("positionText", ""))
+                        cols["wins"].append(entry.get("wins"))
+        return cols
 
     def extract_standings(
         self, start_year: int = DEFAULT_START_YEAR, end_year: int = DEFAULT_END_YEAR
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
         self.logger.info("Extracting standings (%s-%s)...", start_year, end_year)
-        df_const = pd.DataFrame(self._collect_standings(
+        # Each season's standings come back in a single page; fetch both kinds for every season at once.
+        years = list(range(start_year, end_year + 1))
+        kinds = ["constructorStandings", "driverStandings"]
+        pages = self._fetch_many([f"{year}/{kind}" for kind in kinds for year in years])
+        first_pages = {
+            kind: dict(zip(years, pages[i * len(years):(i + 1) * len(years)])) for i, kind in enumerate(kinds)
+        }
+        df_const = self._cast_standings(pd.DataFrame(self._collect_standings(
             start_year, end_year,
             "constructorStandings", "ConstructorStandings", "Constructor", "constructor_ref", "constructorId",
-        ))
-        df_driver = pd.DataFrame(self._collect_standings(
+            first_pages["constructorStandings"],
+        )), "constructor_ref")
+        df_driver = self._cast_standings(pd.DataFrame(self._collect_standings(
             start_year, end_year,
             "driverStandings", "DriverStandings", "Driver", "driver_ref", "driverId",
-        ))
-        self._write_csv_atomic(df_const, "constructor_standings.csv")
-        self._write_csv_atomic(df_driver, "driver_standings.csv")
+            first_pages["driverStandings"],
+        )), "driver_ref")
+        self._write_table(df_const, "constructor_standings")
+        self._write_table(df_driver, "driver_standings")
         self.logger.info("Extracted %s constructor standings.", len(df_const))
         self.logger.info("Extracted %s driver standings.", len(df_driver))
         return df_const, df_driver
@@ -670,6 +887,8 @@ class F1DataExtractor:
         except Exception:
             self.logger.exception("Error during extraction.")
             raise
+        finally:
+            self.close()
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Extract F1 data from Ergast API")
@@ -688,6 +907,14 @@ def main() -> None:
     parser.add_argument('--output', type=str, default='data/raw/', help='Output directory (default: data/raw/)')
     parser.add_argument('--base-delay', type=float, default=0.75, help='Delay between API requests in seconds')
     parser.add_argument('--max-retries', type=int, default=6, help='Max retries on API errors or rate limits')
+    parser.add_argument('--max-workers', type=int, default=4, help='Concurrent per-round requests (default: 4)')
+    parser.add_argument(
+        '--format',
+        choices=TABLE_FORMATS,
+        default=DEFAULT_OUTPUT_FORMAT,
+        help=f'On-disk format for raw tables (default: {DEFAULT_OUTPUT_FORMAT})',
+    )
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached API pages and refetch everything')
     
     args = parser.parse_args()
     
@@ -695,6 +922,9 @@ def main() -> None:
         output_path=args.output,
         base_delay=args.base_delay,
         max_retries=args.max_retries,
+        max_workers=args.max_workers,
+        output_format=args.format,
+        use_cache=not args.no_cache,
     )
     extractor.extract_all(start_year=args.start_year, end_year=args.end_year)
 
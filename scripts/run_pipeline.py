@@ -16,6 +16,7 @@ from extract_data import F1DataExtractor
 from transform_data import F1DataTransformer
 from load_data import F1DataLoader
 from data_quality import run_quality_checks
+from table_io import TABLE_FORMATS, count_rows, find_table
 from extract_telemetry import extract_all as extract_telemetry
 
 
@@ -114,20 +115,12 @@ def _dry_run_preview() -> None:
     logger.info("DRY RUN — extract and transform complete. Would load:")
     headers = ["Table", "Rows", "Status"]
     rows = []
-    for table_name, csv_name, *_ in F1DataLoader._TABLE_SPECS:
-        if csv_name.startswith("raw:"):
-            path = os.path.join("data", "raw", csv_name[4:])
-        else:
-            path = os.path.join("data", "processed", csv_name)
-        if not os.path.exists(path):
-            rows.append([table_name, "—", "missing"])
+    for spec in F1DataLoader._TABLE_SPECS:
+        path = find_table(os.path.join("data", "raw" if spec.raw else "processed"), spec.file_name)
+        if path is None:
+            rows.append([spec.name, "—", "missing"])
             continue
-        try:
-            with open(path) as fh:
-                count = max(0, sum(1 for _ in fh) - 1)
-            rows.append([table_name, str(count), "ready"])
-        except OSError:
-            rows.append([table_name, "—", "error"])
+        rows.append([spec.name, str(count_rows(path)), "ready"])
     print(format_table(headers, rows, {1}))
     logger.info("Re-run without --dry-run to load the above into the database.")
 
@@ -147,10 +140,17 @@ def run_full_pipeline(
     base_delay: float = 1.5,
     max_retries: int = 6,
     max_base_delay: float = 8.0,
+    use_cache: bool = True,
+    output_format: str | None = None,
 ) -> None:
-    """Run extraction, transformation, and loading for the requested year range."""
+    """Run extraction, transformation, and loading for the requested year range.
+
+    ``output_format`` sets the on-disk format of raw and processed tables; each step's own
+    default applies when it is None.
+    """
 
     logger = setup_logging()
+    format_kwargs = {"output_format": output_format} if output_format else {}
 
     start_year, end_year, clamped = _normalize_year_range(start_year, end_year)
     if start_year > end_year:
@@ -173,6 +173,8 @@ def run_full_pipeline(
             base_delay=base_delay,
             max_retries=max_retries,
             max_base_delay=max_base_delay,
+            use_cache=use_cache,
+            **format_kwargs,
         )
         extractor.extract_all(
             start_year=start_year,
@@ -187,6 +189,7 @@ def run_full_pipeline(
         transformer = F1DataTransformer(
             raw_data_path="data/raw/",
             processed_data_path="data/processed/",
+            **format_kwargs,
         )
         transformer.transform_all()
     else:
@@ -237,7 +240,7 @@ def run_full_pipeline(
     logger.info("Pipeline completed successfully.")
     logger.info("Next steps:")
     logger.info("  - Run queries: python scripts/run_queries.py --list")
-    logger.info("  - Export results: python scripts/run_queries.py --query kpi_summary --export")
+    logger.info("  - Export results: python scripts/run_queries.py --query key_performance_indicators --export")
 
 
 def main() -> None:
@@ -290,6 +293,12 @@ Examples:
     parser.add_argument("--base-delay", type=float, default=1.5, help="Delay between API requests in seconds")
     parser.add_argument("--max-retries", type=int, default=6, help="Max retries on API errors or rate limits")
     parser.add_argument("--max-base-delay", type=float, default=8.0, help="Upper bound for adaptive delay")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached API pages and refetch everything")
+    parser.add_argument(
+        "--format",
+        choices=TABLE_FORMATS,
+        help="On-disk format for raw and processed tables (default: parquet; csv for compatibility)",
+    )
     parser.add_argument(
         "--fast",
         action="store_true",
@@ -329,6 +338,8 @@ Examples:
             base_delay=args.base_delay,
             max_retries=args.max_retries,
             max_base_delay=args.max_base_delay,
+            use_cache=not args.no_cache,
+            output_format=args.format,
         )
     except KeyboardInterrupt:
         print("\nPipeline interrupted by user.")
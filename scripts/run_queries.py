@@ -1,12 +1,15 @@
+import functools
 import os
 import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 import yaml
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
@@ -15,6 +18,7 @@ if SCRIPT_DIR not in sys.path:
 from logging_utils import setup_logging, format_table
 from constants import CONSTRUCTOR_ID, TEAM_REFS
 from load_data import _build_connection_string
+from table_io import write_csv
 
 try:
     from config import DB_CONFIG, DATA_PATHS
@@ -30,45 +34,112 @@ _DEFAULT_QUERIES_FILE = os.path.normpath(
     os.path.join(SCRIPT_DIR, "..", "database", "queries", "analytical_queries.yaml")
 )
 
+EXPORT_CHUNKSIZE = 50_000
+# Matches the MySQL engine's pool_size, so concurrent queries never wait on a connection.
+MAX_QUERY_WORKERS = 4
+
 
 def create_db_connection(config: dict | None = None) -> Engine:
-    return create_engine(_build_connection_string(config or DB_CONFIG))
+    """Engine for ``config``; repeat calls with the same database share one engine and its pool."""
+    return _engine_for(_build_connection_string(config or DB_CONFIG))
+
+
+@functools.lru_cache(maxsize=4)
+def _engine_for(url: str) -> Engine:
+    if url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+    # Enough warm connections for concurrent report queries without queueing on the server.
+    return create_engine(url, pool_size=4, max_overflow=0, pool_pre_ping=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _statement(query_text: str) -> TextClause:
+    """Build each query's text() clause once; values always arrive as bind parameters."""
+    return text(query_text)
 
 
 def execute_query(
-    engine: Engine, query_name: str, query_text: str, params: dict | None = None
+    engine: Engine,
+    query_name: str,
+    query_text: str,
+    params: dict | None = None,
+    export_path: str | None = None,
 ) -> pd.DataFrame | None:
+    """Run a query and return its rows.
+
+    With ``export_path`` the result is streamed to CSV in EXPORT_CHUNKSIZE-row chunks through a
+    server-side cursor, and only the first chunk is returned for display.
+    """
     try:
         with engine.connect() as conn:
-            df = pd.read_sql(text(query_text), conn, params=params)
-        return df
+            if export_path is None:
+                return pd.read_sql(_statement(query_text), conn, params=params)
+            first = None
+            chunks = pd.read_sql(
+                _statement(query_text), conn.execution_options(stream_results=True),
+                params=params, chunksize=EXPORT_CHUNKSIZE,
+            )
+            for i, chunk in enumerate(chunks):
+                if i == 0:
+                    first = chunk
+                    if chunk.empty:
+                        break
+                write_csv(chunk, export_path, header=i == 0)
+        if first is not None and not first.empty:
+            logger.info("Exported results to %s.", export_path)
+        return first
     except Exception as e:
         logger.error("Error executing %s: %s", query_name, e)
         return None
 
 
-def export_results(df: pd.DataFrame, filename: str, output_path: str | None = None) -> None:
+def export_path_for(filename: str, output_path: str | None = None) -> str:
     output_path = output_path or DATA_PATHS.get("processed_data", "data/processed/")
     os.makedirs(output_path, exist_ok=True)
-    filepath = os.path.join(output_path, filename)
-    df.to_csv(filepath, index=False)
+    return os.path.join(output_path, filename)
+
+
+def export_results(df: pd.DataFrame, filename: str, output_path: str | None = None) -> None:
+    filepath = export_path_for(filename, output_path)
+    write_csv(df, filepath)
     logger.info("Exported results to %s.", filepath)
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_queries(query_file: str, mtime: float) -> dict[str, str]:
+    # mtime is part of the cache key so an edited file is re-parsed.
+    with open(query_file, "r") as fh:
+        return yaml.safe_load(fh) or {}
+
+
 def load_queries_from_yaml(
     query_file: str = _DEFAULT_QUERIES_FILE,
 ) -> dict[str, str]:
     if not os.path.exists(query_file):
         logger.warning("Query file %s not found.", query_file)
         return {}
-    with open(query_file, "r") as fh:
-        return yaml.safe_load(fh) or {}
+    return dict(_parse_queries(os.path.abspath(query_file), os.path.getmtime(query_file)))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run F1 analytical queries")
     parser.add_argument("--query", type=str, help='Query name to execute (or "all" for all queries)')
     parser.add_argument("--export", action="store_true", help="Export results to CSV")
+    parser.add_argument(
+        "--print", action="store_true", help="Print results even with --export, which otherwise only writes CSVs"
+    )
+    parser.add_argument(
+        "--max-print-rows",
+        type=int,
+        default=50,
+        help="Rows of each result to print (default: 50; 0 prints every row)",
+    )
+    parser.add_argument(
+        "--constructor-id",
+        type=int,
+        default=CONSTRUCTOR_ID,
+        help="Constructor ID bound to :cid in the queries (default: %(default)s, Red Bull)",
+    )
     parser.add_argument("--list", action="store_true", help="List available queries")
     parser.add_argument(
         "--file",
@@ -79,14 +150,15 @@ def main() -> None:
 
     args = parser.parse_args()
     engine = create_db_connection()
-    params = {"cid": CONSTRUCTOR_ID}
+    params = {"cid": args.constructor_id}
     for r in TEAM_REFS:
         if not _REF_RE.match(r):
             raise ValueError(f"Invalid team ref (must be lowercase alphanumeric/underscore): {r!r}")
     team_refs_sql = ", ".join(f"'{r}'" for r in TEAM_REFS)
 
+    is_sqlite = (DB_CONFIG or {}).get("type", "sqlite") == "sqlite"
     sqlite_version = None
-    if (DB_CONFIG or {}).get("type", "sqlite") == "sqlite":
+    if is_sqlite:
         with engine.connect() as conn:
             row = conn.execute(text("SELECT sqlite_version()")).fetchone()
             if row:
@@ -106,6 +178,7 @@ def main() -> None:
     if args.query:
         targets = list(queries.items()) if args.query == "all" else [(args.query, queries.get(args.query))]
 
+        runnable = []
         for query_name, query_text in targets:
             if not query_text:
                 logger.warning("Query '%s' not found. Use --list to see available queries.", query_name)
@@ -117,19 +190,36 @@ def main() -> None:
                     query_name, ".".join(str(x) for x in sqlite_version),
                 )
                 continue
-            logger.info("Executing %s...", query_name)
             resolved = query_text.replace("{team_refs}", team_refs_sql)
-            df = execute_query(engine, query_name, resolved, params=params)
-
-            if df is not None and not df.empty:
-                headers = list(df.columns)
-                rows = df.values.tolist()
-                right_cols = {i for i, col in enumerate(df.columns) if pd.api.types.is_numeric_dtype(df[col])}
-                print(format_table(headers, rows, right_cols))
-                if args.export:
-                    export_results(df, f"{query_name}_results.csv")
-            else:
-                logger.warning("No results returned for %s.", query_name)
+            export_path = export_path_for(f"{query_name}_results.csv") if args.export else None
+            runnable.append((query_name, resolved, export_path))
+
+        # The queries are independent reads, so they run concurrently on a server database; results
+        # print in query order. SQLite gets one worker: the file may be mid-write by load_data
+        # (synchronous=OFF), and a local file gains little from parallel readers anyway.
+        workers = 1 if is_sqlite else max(1, min(MAX_QUERY_WORKERS, len(runnable)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            for query_name, resolved, export_path in runnable:
+                logger.info("Executing %s...", query_name)
+                futures.append(
+                    pool.submit(execute_query, engine, query_name, resolved, params=params, export_path=export_path)
+                )
+            show = args.print or not args.export
+            for (query_name, _, _), future in zip(runnable, futures):
+                df = future.result()
+                if df is not None and not df.empty:
+                    if not show:
+                        continue
+                    if 0 < args.max_print_rows < len(df):
+                        logger.info("%s: showing the first %s rows.", query_name, args.max_print_rows)
+                        df = df.head(args.max_print_rows)
+                    headers = list(df.columns)
+                    rows = df.values.tolist()
+                    right_cols = {i for i, col in enumerate(df.columns) if pd.api.types.is_numeric_dtype(df[col])}
+                    print(format_table(headers, rows, right_cols))
+                else:
+                    logger.warning("No results returned for %s.", query_name)
     else:
         logger.info("Use --query <name> or --query all. Use --list to see available queries.")
 
@@ -0,0 +1,286 @@
+import operator
+import os
+from collections.abc import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# Read preference when the same table exists in more than one format.
+TABLE_FORMATS = ("parquet", "feather", "csv")
+_EXTENSIONS = {"parquet": ".parquet", "feather": ".feather", "csv": ".csv"}
+# Smallest file that can hold a header and a row.
+MIN_TABLE_BYTES = 10
+_FILTER_OPS = {"==": operator.eq, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def table_path(directory: str, name: str, fmt: str) -> str:
+    """Path of table ``name`` in ``fmt``; a trailing extension on ``name`` is ignored."""
+    if fmt not in _EXTENSIONS:
+        raise ValueError(f"Unsupported table format: {fmt!r} (expected one of {', '.join(TABLE_FORMATS)})")
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, stem + _EXTENSIONS[fmt])
+
+
+def find_table(directory: str, name: str) -> str | None:
+    """Return the path of ``name`` in the first format present on disk, or None."""
+    for fmt in TABLE_FORMATS:
+        path = table_path(directory, name, fmt)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def file_size(path: str | None) -> int:
+    """Size of the file in bytes, 0 when missing; one stat call."""
+    if path is None:
+        return 0
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def is_empty(path: str | None) -> bool:
+    """True when the file is missing or too small to hold a header and a row."""
+    return file_size(path) < MIN_TABLE_BYTES
+
+
+def table_columns(path: str) -> list[str]:
+    """Column names of a table file, read from its footer/header only."""
+    if path.endswith(_EXTENSIONS["parquet"]):
+        return pq.read_schema(path).names
+    if path.endswith(_EXTENSIONS["feather"]):
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).schema.names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def read_table(
+    path: str,
+    filters: list[tuple] | None = None,
+    csv_engine: str = "c",
+    columns: list[str] | None = None,
+    dtype: dict[str, str] | None = None,
+    dtype_backend: str | None = None,
+) -> pd.DataFrame:
+    """Read a table; ``filters`` are (column, op, value) tuples, pushed down to row groups for parquet.
+
+    ``columns`` projects the read: only those present in the file are parsed, in the order given.
+    ``dtype`` pins CSV column types (typed formats already carry theirs); absent columns are ignored.
+    ``dtype_backend="numpy_nullable"`` likewise applies to CSV only: integer columns with gaps
+    come back as ``Int64`` rather than float64, as they already do from parquet/feather.
+    ``csv_engine="pyarrow"`` parses CSV with Arrow's multithreaded reader; it also turns ISO
+    date/time text into ``date``/``time`` objects, so use it only where those columns are coerced.
+    """
+    if columns is not None:
+        available = set(table_columns(path))
+        columns = [col for col in columns if col in available]
+    if path.endswith(_EXTENSIONS["parquet"]):
+        df = pd.read_parquet(path, engine="pyarrow", columns=columns, filters=filters or None)
+    else:
+        if path.endswith(_EXTENSIONS["feather"]):
+            df = pd.read_feather(path, columns=columns)
+        else:
+            backend = {"dtype_backend": dtype_backend} if dtype_backend else {}
+            df = pd.read_csv(path, engine=csv_engine, usecols=columns, dtype=dtype, **backend)
+        for column, op, value in filters or []:
+            df = df[_FILTER_OPS[op](df[column], value)]
+        if filters:
+            df = df.reset_index(drop=True)
+    # Readers return projected columns in file order.
+    return df[columns] if columns is not None else df
+
+
+def iter_table(
+    path: str,
+    chunksize: int,
+    columns: list[str] | None = None,
+    dtype: dict[str, str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a table as frames of at most ``chunksize`` rows; ``columns``/``dtype`` as in read_table."""
+    if columns is not None:
+        available = set(table_columns(path))
+        columns = [col for col in columns if col in available]
+    if path.endswith(_EXTENSIONS["parquet"]):
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif path.endswith(_EXTENSIONS["feather"]):
+        # Record batch by record batch from the memory-mapped file, so only one batch is
+        # decompressed and converted at a time.
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if columns is not None:
+                    batch = batch.select(columns)
+                for start in range(0, batch.num_rows, chunksize):
+                    yield batch.slice(start, chunksize).to_pandas()
+    else:
+        with pd.read_csv(path, usecols=columns, dtype=dtype, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk[columns] if columns is not None else chunk
+
+
+def write_csv(df: pd.DataFrame, path: str, header: bool = True) -> None:
+    """Write (``header``) or append ``df`` as CSV with Arrow's C++ writer.
+
+    Frames with datetime columns go through pandas' writer, which keeps dates as plain
+    ``YYYY-MM-DD`` (Arrow would write full nanosecond timestamps); so do columns Arrow cannot
+    type, such as mixed-type objects.
+    """
+    table = None
+    if not any(pd.api.types.is_datetime64_any_dtype(dtype) for dtype in df.dtypes):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    if table is None:
+        df.to_csv(path, mode="w" if header else "a", header=header, index=False, lineterminator="\n")
+        return
+    with open(path, "wb" if header else "ab") as handle:
+        pacsv.write_csv(table, handle, pacsv.WriteOptions(include_header=header))
+
+
+def write_table(df: pd.DataFrame, directory: str, name: str, fmt: str) -> str:
+    """Atomically write ``df`` and remove copies of the table in other formats."""
+    path = table_path(directory, name, fmt)
+    tmp_path = f"{path}.tmp"
+    if fmt == "parquet":
+        df.to_parquet(tmp_path, engine="pyarrow", compression="snappy", index=False)
+    elif fmt == "feather":
+        # Arrow IPC skips parquet's page encoding; cheapest to write for local dev iterations.
+        df.reset_index(drop=True).to_feather(tmp_path, compression="zstd", compression_level=3)
+    else:
+        write_csv(df, tmp_path)
+    os.replace(tmp_path, path)
+    _remove_siblings(directory, name, fmt)
+    return path
+
+
+def _remove_siblings(directory: str, name: str, fmt: str) -> None:
+    # A stale sibling would shadow (or be shadowed by) the fresh file on the next read.
+    for other in TABLE_FORMATS:
+        other_path = table_path(directory, name, other)
+        if other != fmt and os.path.exists(other_path):
+            os.remove(other_path)
+
+
+class TableWriter:
+    """Append DataFrame batches to one table; the file replaces the old one only on a clean close.
+
+    Usage::
+
+        with TableWriter(directory, "results", "parquet", columns) as writer:
+            for batch in batches:
+                writer.write(batch)
+    """
+
+    def __init__(self, directory: str, name: str, fmt: str, columns: list[str]):
+        self.directory = directory
+        self.name = name
+        self.fmt = fmt
+        self.columns = columns
+        self.path = table_path(directory, name, fmt)
+        self.rows = 0
+        self._tmp_path = f"{self.path}.tmp"
+        self._writer = None
+        self._schema = None
+        self._pending: list[pa.Table] = []
+        self._started = False
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def _stream_schema(self, schema: pa.Schema) -> pa.Schema:
+        # Every batch is cast to one file schema, so widen anything batch-specific: per-batch
+        # dictionary index widths, and columns that never held a value (stored as strings).
+        # Arrow IPC files cannot swap dictionaries between batches, so Feather stores
+        # categoricals as their values.
+        fields = []
+        for field in schema:
+            if pa.types.is_null(field.type):
+                field = field.with_type(pa.string())
+            elif pa.types.is_dictionary(field.type):
+                value_type = field.type.value_type
+                field = field.with_type(value_type if self.fmt == "feather" else pa.dictionary(pa.int32(), value_type))
+            fields.append(field)
+        return pa.schema(fields, metadata=schema.metadata)
+
+    def write(self, batch: pd.DataFrame | pa.Table) -> None:
+        if not len(batch):
+            return
+        if self.fmt == "csv":
+            df = batch.to_pandas() if isinstance(batch, pa.Table) else batch
+            write_csv(df, self._tmp_path, header=not self._started)
+        else:
+            table = batch if isinstance(batch, pa.Table) else pa.Table.from_pandas(batch, preserve_index=False)
+            if self._writer is not None:
+                self._writer.write_table(table.cast(self._schema))
+            else:
+                # An all-null column has no type yet; hold batches until one carries a value.
+                self._pending.append(table)
+                if not any(pa.types.is_null(field.type) for field in self._unified_schema()):
+                    self._open_writer()
+        self._started = True
+        self.rows += len(batch)
+
+    def _unified_schema(self) -> pa.Schema:
+        return pa.unify_schemas([t.schema for t in self._pending], promote_options="permissive")
+
+    def _open_writer(self) -> None:
+        self._schema = self._stream_schema(self._unified_schema())
+        if self.fmt == "parquet":
+            self._writer = pq.ParquetWriter(self._tmp_path, self._schema, compression="snappy")
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=pa.Codec("zstd", compression_level=3))
+            self._writer = pa.ipc.new_file(self._tmp_path, self._schema, options=options)
+        for table in self._pending:
+            self._writer.write_table(table.cast(self._schema))
+        self._pending = []
+
+    def close(self) -> str:
+        if not self._started:
+            return write_table(pd.DataFrame(columns=self.columns), self.directory, self.name, self.fmt)
+        if self._pending:
+            self._open_writer()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        os.replace(self._tmp_path, self.path)
+        _remove_siblings(self.directory, self.name, self.fmt)
+        return self.path
+
+    def _discard(self) -> None:
+        self._pending = []
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def count_rows(path: str | None) -> int:
+    """Data rows in a table file; 0 when missing or unreadable."""
+    if is_empty(path):
+        return 0
+    try:
+        if path.endswith(_EXTENSIONS["parquet"]):
+            return pq.ParquetFile(path).metadata.num_rows
+        if path.endswith(_EXTENSIONS["feather"]):
+            return feather.read_table(path, columns=[]).num_rows
+        with open(path, "r") as handle:
+            count = -1
+            for count, _ in enumerate(handle):
+                pass
+            return max(count, 0)
+    except (OSError, ValueError):
+        return 0
@@ -2,8 +2,14 @@
 Data transformation utilities for F1 analytics.
 """
 
+import argparse
+import json
 import os
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
 
@@ -13,44 +19,159 @@ if SCRIPT_DIR not in sys.path:
 
 from logging_utils import setup_logging
 from constants import DNF_POSITION_ORDER
+from table_io import (
+    MIN_TABLE_BYTES,
+    TABLE_FORMATS,
+    TableWriter,
+    file_size,
+    find_table,
+    iter_table,
+    read_table,
+    write_table,
+)
+
+# The big per-round CSVs go through Arrow's multithreaded reader once they reach this size; below
+# it the C engine wins on start-up cost. Their text columns are pinned so both engines agree and
+# Arrow does not turn lap or pit times into time objects.
+_ARROW_CSV_MIN_BYTES = 1 << 20
+_CSV_TEXT_COLUMNS = {
+    "results.csv": ["driver_ref", "constructor_ref", "position_text", "time_result", "fastest_lap_time", "status"],
+    "pit_stops.csv": ["driver_ref", "time_of_day", "duration"],
+    "constructor_standings.csv": ["constructor_ref", "position_text"],
+    "driver_standings.csv": ["driver_ref", "position_text"],
+}
+# Results and pit stops are cleaned row by row, so they are streamed in chunks of this many rows;
+# CSVs below _CSV_CHUNKED_MIN_BYTES are still parsed in one go.
+_CHUNK_ROWS = 200_000
+_CSV_CHUNKED_MIN_BYTES = 64 << 20
+# Counts and small ordinals are stored narrow; anything not listed here stays int64. Points
+# are multiples of 0.5 (exact in float32) and keep their fractions.
+_SMALL_INT_DTYPES = {
+    "number": "int16",
+    "driver_number": "int16",
+    "laps": "int16",
+    "fastest_lap": "int16",
+    "fastest_lap_rank": "int16",
+    "position": "int16",
+    "position_order": "int16",
+    "wins": "int16",
+}
+_POINTS_DTYPE = "float32"
+# Qualifying lap times as written by Ergast: "1:29.179", with minutes omitted under a minute.
+_LAP_TIME_PATTERN = r"^(?:(\d+):)?(\d+)\.(\d{1,3})$"
+_QUALIFYING_SESSIONS = ("q1", "q2", "q3")
+# transform_all records the raw inputs it ran on here and skips the next run if nothing changed.
+_STATE_FILE = ".transform_state.json"
+_RAW_TABLES = (
+    "circuits.csv", "drivers.csv", "constructors.csv", "races.csv", "results.csv",
+    "qualifying.csv", "pit_stops.csv", "constructor_standings.csv", "driver_standings.csv",
+)
+_CLEAN_TABLES = (
+    "circuits_clean.csv", "drivers_clean.csv", "races_clean.csv", "results_clean.csv", "qualifying_clean.csv",
+    "pit_stops_clean.csv", "constructor_standings_clean.csv", "driver_standings_clean.csv",
+)
+# Ref files the transforms map through: (file, ref column, id column).
+_REF_MAPS = (
+    ("circuits.csv", "circuit_ref", "circuit_id"),
+    ("drivers.csv", "driver_ref", "driver_id"),
+    ("constructors.csv", "constructor_ref", "constructor_id"),
+)
 
 
 class F1DataTransformer:
-    def __init__(self, raw_data_path: str = "data/raw/", processed_data_path: str = "data/processed/") -> None:
+    def __init__(
+        self,
+        raw_data_path: str = "data/raw/",
+        processed_data_path: str = "data/processed/",
+        output_format: str = "parquet",
+    ) -> None:
+        if output_format not in TABLE_FORMATS:
+            raise ValueError(f"output_format must be one of {', '.join(TABLE_FORMATS)}; got {output_format!r}")
         self.raw_path = raw_data_path
         self.processed_path = processed_data_path
+        self.output_format = output_format
         self.logger = setup_logging()
+        # Ref→id maps keyed by (filename, ref_col, id_col); drivers/constructors serve several tables.
+        self._ref_maps: dict[tuple[str, str, str], pd.Series] = {}
+        # Resolved raw table paths by name; only hits are kept, so a table written later is still found.
+        self._raw_paths: dict[str, str] = {}
         os.makedirs(raw_data_path, exist_ok=True)
         os.makedirs(processed_data_path, exist_ok=True)
 
-    def _read_csv_safe(self, filename: str) -> pd.DataFrame | None:
-        """Return a DataFrame, or None with a warning if the file is missing or empty."""
-        path = os.path.join(self.raw_path, filename)
-        if not os.path.exists(path) or os.path.getsize(path) < 10:
+    def _raw_table(self, filename: str) -> str | None:
+        """Path of raw table ``filename`` in whichever format is on disk, or None."""
+        path = self._raw_paths.get(filename)
+        if path is None:
+            path = find_table(self.raw_path, filename)
+            if path is not None:
+                self._raw_paths[filename] = path
+        return path
+
+    def _read_csv_safe(self, filename: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+        """Return a raw table (parquet or CSV), or None with a warning if it is missing or empty.
+
+        ``columns`` limits parsing to the columns a transform uses; any the file lacks are skipped.
+        """
+        path = self._raw_table(filename)
+        size = file_size(path)
+        if size < MIN_TABLE_BYTES:
             self.logger.warning("%s is missing or empty.", filename)
             return None
+        text_columns = _CSV_TEXT_COLUMNS.get(filename)
+        engine = "pyarrow" if text_columns and size >= _ARROW_CSV_MIN_BYTES else "c"
+        dtype = dict.fromkeys(text_columns, "string") if text_columns else None
         try:
-            return pd.read_csv(path)
+            return read_table(path, columns=columns, csv_engine=engine, dtype=dtype)
         except pd.errors.EmptyDataError:
             self.logger.warning("%s has no parseable data.", filename)
             return None
 
-    def _load_ref_map(self, filename: str, ref_col: str, id_col: str) -> dict:
-        df = pd.read_csv(os.path.join(self.raw_path, filename))
-        if id_col not in df.columns:
-            df[id_col] = range(1, len(df) + 1)
-        return dict(zip(df[ref_col], df[id_col]))
+    def _iter_raw(self, filename: str, columns: list[str]) -> Iterator[pd.DataFrame]:
+        """Yield a raw table in row chunks; yields nothing (after a warning) if it is missing or empty."""
+        path = self._raw_table(filename)
+        size = file_size(path)
+        if size < MIN_TABLE_BYTES or (path.endswith(".csv") and size < _CSV_CHUNKED_MIN_BYTES):
+            df = self._read_csv_safe(filename, columns=columns)
+            if df is not None:
+                yield df
+            return
+        text_columns = _CSV_TEXT_COLUMNS.get(filename)
+        dtype = dict.fromkeys(text_columns, "string") if text_columns else None
+        yield from iter_table(path, _CHUNK_ROWS, columns=columns, dtype=dtype)
+
+    def _write_clean(self, df: pd.DataFrame, filename: str) -> None:
+        """Write a cleaned table; typed formats spare the loader a CSV parse and type inference."""
+        write_table(df, self.processed_path, filename, self.output_format)
+
+    def _load_ref_map(self, filename: str, ref_col: str, id_col: str) -> pd.Series:
+        """IDs indexed by unique ref; a repeated ref keeps its last ID, as a dict of the rows would."""
+        key = (filename, ref_col, id_col)
+        if key not in self._ref_maps:
+            path = self._raw_table(filename)
+            if path is None:
+                raise FileNotFoundError(os.path.join(self.raw_path, filename))
+            df = read_table(path, columns=[ref_col, id_col])
+            if id_col not in df.columns:
+                df[id_col] = np.arange(1, len(df) + 1, dtype=np.int32)
+            ids = pd.Series(df[id_col].to_numpy(), index=df[ref_col].to_numpy())
+            self._ref_maps[key] = ids[~ids.index.duplicated(keep="last")].dropna()
+        return self._ref_maps[key]
 
     def _apply_ref_map(self, df: pd.DataFrame, ref_col: str, id_col: str, filename: str) -> pd.DataFrame:
         """Map ref strings to integer IDs; drops rows that cannot be mapped."""
+        if id_col in df.columns and df[id_col].notna().all():
+            # Ergast-style raw tables carry the IDs already; no ref map to read or gather through.
+            return df.assign(**{id_col: df[id_col].astype(int)})
         try:
             ref_map = self._load_ref_map(filename, ref_col, id_col)
         except (FileNotFoundError, KeyError):
             self.logger.warning("Ref map file %s not found; dropping all %s rows.", filename, ref_col)
             return df.iloc[0:0].copy()
 
-        mapped = df[ref_col].map(ref_map)
-        unmapped_count = int(mapped.isna().sum())
+        # One hash-table gather over the ref index instead of a per-row dict lookup.
+        positions = ref_map.index.get_indexer(df[ref_col])
+        found = positions >= 0
+        unmapped_count = int(len(found) - found.sum())
         if unmapped_count:
             dropout_pct = 100.0 * unmapped_count / len(df)
             msg = "Dropping %s rows (%.1f%%) with unmapped %s values (not in %s)."
@@ -58,11 +179,12 @@ class F1DataTransformer:
                 self.logger.error(msg, unmapped_count, dropout_pct, ref_col, filename)
             else:
                 self.logger.warning(msg, unmapped_count, dropout_pct, ref_col, filename)
-            df = df[mapped.notna()].copy()
-            mapped = mapped[mapped.notna()]
+            df = df.loc[found]
+            positions = positions[found]
 
-        df[id_col] = mapped.astype(int)
-        return df
+        # assign() rather than a defensive .copy() of the filtered frame: under Copy-on-Write
+        # the untouched columns stay shared with the read instead of being duplicated.
+        return df.assign(**{id_col: ref_map.to_numpy()[positions].astype(int)})
 
     def _coerce_datetime(self, df: pd.DataFrame, col: str) -> pd.DataFrame:
         before = int(df[col].notna().sum())
@@ -72,48 +194,56 @@ class F1DataTransformer:
             self.logger.warning("Coerced %s invalid values to NaT in column '%s'.", lost, col)
         return df
 
+    @staticmethod
+    def _coerce_int_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+        """Coerce the present ``cols`` to integers in one pass, filling missing/invalid values with 0.
+
+        Each column takes its width from _SMALL_INT_DTYPES (int64 otherwise).
+        """
+        present = [col for col in cols if col in df.columns]
+        if present:
+            dtypes = {col: _SMALL_INT_DTYPES.get(col, "int64") for col in present}
+            df[present] = df[present].apply(pd.to_numeric, errors="coerce").fillna(0).astype(dtypes)
+        return df
+
+    @staticmethod
+    def _select_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+        """``df`` with exactly ``columns`` in order; one reindex adds any missing ones as null object columns."""
+        missing = [col for col in columns if col not in df.columns]
+        return df.reindex(columns=columns).astype(dict.fromkeys(missing, object))
+
+    @staticmethod
+    def _lap_time_ms(values: pd.Series) -> pd.Series:
+        """``m:ss.sss`` lap times as Int32 milliseconds; blank or unparseable times are <NA>."""
+        parts = values.astype(str).str.extract(_LAP_TIME_PATTERN)
+        minutes = pd.to_numeric(parts[0]).fillna(0)
+        seconds = pd.to_numeric(parts[1])
+        millis = pd.to_numeric(parts[2].str.ljust(3, "0"))
+        return (minutes * 60_000 + seconds * 1000 + millis).astype("Int32")
+
+    @staticmethod
+    def _float_array(df: pd.DataFrame, col: str) -> np.ndarray:
+        """``col`` as float64 with invalid or missing values as NaN; all NaN when the column is absent."""
+        if col not in df.columns:
+            return np.full(len(df), np.nan)
+        return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
     def transform_circuits(self) -> pd.DataFrame:
-        df = self._read_csv_safe("circuits.csv")
+        circuit_columns = ["circuit_ref", "circuit_name", "location", "country", "lat", "lng", "altitude", "url"]
+        df = self._read_csv_safe("circuits.csv", columns=circuit_columns)
         if df is None:
             empty = pd.DataFrame()
-            empty.to_csv(f"{self.processed_path}circuits_clean.csv", index=False)
+            self._write_clean(empty, "circuits_clean.csv")
             return empty
 
-        df["circuit_id"] = range(1, len(df) + 1)
+        df["circuit_id"] = np.arange(1, len(df) + 1, dtype=np.int32)
         # Leave altitude as NaN when missing — 0 is valid (sea level) and must stay distinguishable.
-        df = df[[
-            "circuit_id",
-            "circuit_ref",
-            "circuit_name",
-            "location",
-            "country",
-            "lat",
-            "lng",
-            "altitude",
-            "url",
-        ]]
-        df.to_csv(f"{self.processed_path}circuits_clean.csv", index=False)
+        df = df[["circuit_id", *circuit_columns]]
+        self._write_clean(df, "circuits_clean.csv")
         self.logger.info("Transformed %s circuits.", len(df))
         return df
 
     def transform_drivers(self) -> pd.DataFrame:
-        df = self._read_csv_safe("drivers.csv")
-        if df is None:
-            empty = pd.DataFrame()
-            empty.to_csv(f"{self.processed_path}drivers_clean.csv", index=False)
-            return empty
-
-        if "driver_id" not in df.columns:
-            df["driver_id"] = range(1, len(df) + 1)
-
-        if "dob" in df.columns:
-            df = self._coerce_datetime(df, "dob")
-
-        if "driver_number" in df.columns:
-            df["driver_number"] = df["driver_number"].fillna(0).astype(int)
-        else:
-            df["driver_number"] = 0
-
         required_cols = [
             "driver_id",
             "driver_ref",
@@ -125,20 +255,43 @@ class F1DataTransformer:
             "nationality",
             "url",
         ]
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = "" if col in {"code", "url"} else None
+        df = self._read_csv_safe("drivers.csv", columns=required_cols)
+        if df is None:
+            empty = pd.DataFrame()
+            self._write_clean(empty, "drivers_clean.csv")
+            return empty
+
+        if "driver_id" not in df.columns:
+            df["driver_id"] = np.arange(1, len(df) + 1, dtype=np.int32)
 
-        df = df[required_cols]
-        df.to_csv(f"{self.processed_path}drivers_clean.csv", index=False)
+        if "dob" in df.columns:
+            df = self._coerce_datetime(df, "dob")
+
+        if "driver_number" not in df.columns:
+            df["driver_number"] = 0
+        df = self._coerce_int_columns(df, ["driver_number"])
+
+        missing_text = {col: "" for col in ("code", "url") if col not in df.columns}
+        df = self._select_columns(df, required_cols).assign(**missing_text)
+        self._write_clean(df, "drivers_clean.csv")
         self.logger.info("Transformed %s drivers.", len(df))
         return df
 
     def transform_races(self) -> pd.DataFrame:
-        df = self._read_csv_safe("races.csv")
+        required_cols = [
+            "race_id",
+            "year",
+            "round",
+            "circuit_id",
+            "race_name",
+            "race_date",
+            "race_time",
+            "url",
+        ]
+        df = self._read_csv_safe("races.csv", columns=[*required_cols, "circuit_ref"])
         if df is None:
             empty = pd.DataFrame()
-            empty.to_csv(f"{self.processed_path}races_clean.csv", index=False)
+            self._write_clean(empty, "races_clean.csv")
             return empty
 
         if "race_date" in df.columns:
@@ -155,120 +308,106 @@ class F1DataTransformer:
         if "race_id" in df.columns:
             df["race_id"] = df["race_id"].astype(int)
         else:
-            df["race_id"] = (
-                df["year"].astype(str) + df["round"].astype(str).str.zfill(2)
-            ).astype(int)
+            df["race_id"] = df["year"].to_numpy(dtype=np.int32) * 100 + df["round"].to_numpy(dtype=np.int32)
 
-        required_cols = [
-            "race_id",
-            "year",
-            "round",
-            "circuit_id",
-            "race_name",
-            "race_date",
-            "race_time",
-            "url",
-        ]
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = None
-        df = df[required_cols]
+        df = self._select_columns(df, required_cols)
 
-        df.to_csv(f"{self.processed_path}races_clean.csv", index=False)
+        self._write_clean(df, "races_clean.csv")
         self.logger.info("Transformed %s races.", len(df))
         return df
 
-    def transform_results(self) -> pd.DataFrame:
+    def transform_results(self) -> int:
+        """Clean results chunk by chunk into results_clean; returns the number of rows written."""
         results_columns = [
-            "race_id", "driver_ref", "constructor_ref", "number", "grid",
+            "race_id", "driver_id", "constructor_id", "driver_ref", "constructor_ref", "number", "grid",
             "position", "position_text", "position_order", "points", "laps",
             "time_result", "milliseconds", "fastest_lap", "fastest_lap_rank",
             "fastest_lap_time", "fastest_lap_speed", "status",
         ]
-        df = self._read_csv_safe("results.csv")
-        if df is None:
-            empty = pd.DataFrame(columns=results_columns)
-            empty.to_csv(f"{self.processed_path}results_clean.csv", index=False)
-            return empty
+        with TableWriter(self.processed_path, "results_clean.csv", self.output_format, results_columns) as writer:
+            for chunk in self._iter_raw("results.csv", results_columns):
+                writer.write(self._clean_results(chunk))
+        self.logger.info("Transformed %s results.", writer.rows)
+        return writer.rows
 
+    def _clean_results(self, df: pd.DataFrame) -> pd.DataFrame:
         df = self._apply_ref_map(df, "driver_ref", "driver_id", "drivers.csv")
         df = self._apply_ref_map(df, "constructor_ref", "constructor_id", "constructors.csv")
 
-        if "position" in df.columns:
-            df["position"] = pd.to_numeric(df["position"], errors="coerce")
+        # grid=0 is a valid F1 value (pit-lane start); preserve NULL for missing data.
+        nullable = [col for col in ("position", "grid") if col in df.columns]
+        if nullable:
+            df[nullable] = df[nullable].apply(pd.to_numeric, errors="coerce")
 
         if "position_text" in df.columns:
             df["position_text"] = df["position_text"].fillna("").astype(str)
         else:
             df["position_text"] = ""
 
-        for col in ["points", "laps", "number", "fastest_lap", "fastest_lap_rank"]:
-            if col in df.columns:
-                df[col] = df[col].fillna(0).astype(int)
-
-        # grid=0 is a valid F1 value (pit-lane start); preserve NULL for missing data.
-        if "grid" in df.columns:
-            df["grid"] = pd.to_numeric(df["grid"], errors="coerce")
+        if "milliseconds" not in df.columns:
+            df["milliseconds"] = 0
+        df = self._coerce_int_columns(df, ["laps", "number", "fastest_lap", "fastest_lap_rank", "milliseconds"])
+        if "points" in df.columns:
+            df["points"] = pd.to_numeric(df["points"], errors="coerce").fillna(0).astype(_POINTS_DTYPE)
 
         if "fastest_lap_speed" in df.columns:
             df["fastest_lap_speed"] = df["fastest_lap_speed"].fillna("").astype(str)
         else:
             df["fastest_lap_speed"] = ""
 
-        if "milliseconds" in df.columns:
-            df["milliseconds"] = pd.to_numeric(df["milliseconds"], errors="coerce").fillna(0).astype(int)
-        else:
-            df["milliseconds"] = 0
-
         if "status" not in df.columns:
             df["status"] = ""
-
-        if "position_order" not in df.columns:
-            # Derive from position as fallback. Non-numeric position (R=retired, D/DQ=disqualified)
-            # all map to the same sentinel; use the `status` column to distinguish DNF vs DSQ downstream.
-            df["position_order"] = df["position"].fillna(DNF_POSITION_ORDER)
-        df["position_order"] = pd.to_numeric(
-            df["position_order"], errors="coerce"
-        ).fillna(DNF_POSITION_ORDER).astype(int)
-
-        df.to_csv(f"{self.processed_path}results_clean.csv", index=False)
-        self.logger.info("Transformed %s results.", len(df))
+        # A few hundred distinct statuses across every result: stored as dictionary codes in the
+        # clean table rather than one string per row (raw tables from the extractor already are).
+        df["status"] = df["status"].astype("category")
+
+        # Derive from position as fallback. Non-numeric position (R=retired, D/DQ=disqualified)
+        # all map to the same sentinel; use the `status` column to distinguish DNF vs DSQ downstream.
+        source = df["position_order"] if "position_order" in df.columns else df["position"]
+        df["position_order"] = (
+            pd.to_numeric(source, errors="coerce").fillna(DNF_POSITION_ORDER).astype(_SMALL_INT_DTYPES["position_order"])
+        )
         return df
 
     def transform_qualifying(self) -> pd.DataFrame:
         qualifying_columns = [
-            "race_id", "driver_ref", "constructor_ref", "number", "position", "q1", "q2", "q3",
+            "race_id", "driver_id", "constructor_id", "driver_ref", "constructor_ref",
+            "number", "position", "q1", "q2", "q3",
         ]
-        df = self._read_csv_safe("qualifying.csv")
+        df = self._read_csv_safe("qualifying.csv", columns=qualifying_columns)
         if df is None:
-            empty = pd.DataFrame(columns=qualifying_columns)
-            empty.to_csv(f"{self.processed_path}qualifying_clean.csv", index=False)
+            empty = pd.DataFrame(columns=[*qualifying_columns, *(f"{col}_ms" for col in _QUALIFYING_SESSIONS)])
+            self._write_clean(empty, "qualifying_clean.csv")
             return empty
 
         df = self._apply_ref_map(df, "driver_ref", "driver_id", "drivers.csv")
         df = self._apply_ref_map(df, "constructor_ref", "constructor_id", "constructors.csv")
 
-        for col in ["q1", "q2", "q3"]:
+        # The text times are what the database stores; the parsed milliseconds ride along in the
+        # clean table so analysis on it can compare integers.
+        for col in _QUALIFYING_SESSIONS:
             if col in df.columns:
                 df[col] = df[col].fillna("")
             else:
                 df[col] = ""
+            df[f"{col}_ms"] = self._lap_time_ms(df[col])
 
-        for col in ["position", "number"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+        df = self._coerce_int_columns(df, ["position", "number"])
 
-        df.to_csv(f"{self.processed_path}qualifying_clean.csv", index=False)
+        self._write_clean(df, "qualifying_clean.csv")
         self.logger.info("Transformed %s qualifying results.", len(df))
         return df
 
-    def transform_pit_stops(self) -> pd.DataFrame:
-        df = self._read_csv_safe("pit_stops.csv")
-        if df is None:
-            empty = pd.DataFrame()
-            empty.to_csv(f"{self.processed_path}pit_stops_clean.csv", index=False)
-            return empty
+    def transform_pit_stops(self) -> int:
+        """Clean pit stops chunk by chunk into pit_stops_clean; returns the number of rows written."""
+        pit_stop_columns = ["race_id", "driver_id", "driver_ref", "stop", "lap", "time_of_day", "duration", "milliseconds"]
+        with TableWriter(self.processed_path, "pit_stops_clean.csv", self.output_format, pit_stop_columns) as writer:
+            for chunk in self._iter_raw("pit_stops.csv", pit_stop_columns):
+                writer.write(self._clean_pit_stops(chunk))
+        self.logger.info("Transformed %s pit stops.", writer.rows)
+        return writer.rows
 
+    def _clean_pit_stops(self, df: pd.DataFrame) -> pd.DataFrame:
         df = self._apply_ref_map(df, "driver_ref", "driver_id", "drivers.csv")
 
         if "time_of_day" in df.columns:
@@ -276,29 +415,28 @@ class F1DataTransformer:
         else:
             df["time_of_day"] = "00:00:00"
 
-        if "milliseconds" not in df.columns or df["milliseconds"].isna().all():
-            if "duration" in df.columns:
-                df["milliseconds"] = pd.to_numeric(df["duration"], errors="coerce") * 1000
-            else:
-                df["milliseconds"] = 0
-
-        df["milliseconds"] = pd.to_numeric(df["milliseconds"], errors="coerce").fillna(0).astype(int)
-
-        df.to_csv(f"{self.processed_path}pit_stops_clean.csv", index=False)
-        self.logger.info("Transformed %s pit stops.", len(df))
+        # Per row, so the result does not depend on how the table was chunked: a stop without
+        # milliseconds takes them from its duration in seconds. One pass over float arrays;
+        # rounded rather than truncated, since e.g. 1.001 s * 1000 lands just below 1001.
+        milliseconds = self._float_array(df, "milliseconds")
+        duration_ms = self._float_array(df, "duration") * 1000
+        milliseconds = np.where(np.isnan(milliseconds), duration_ms, milliseconds)
+        df["milliseconds"] = np.nan_to_num(np.rint(milliseconds), nan=0).astype(np.int64)
         return df
 
     def _transform_standings_df(
         self, filename: str, ref_col: str, id_col: str, ref_filename: str, out_filename: str
     ) -> pd.DataFrame:
-        df = self._read_csv_safe(filename)
+        df = self._read_csv_safe(
+            filename, columns=["race_id", id_col, ref_col, "points", "position", "position_text", "wins"]
+        )
         if df is None or df.empty:
             self.logger.info("No %s to transform.", filename)
             return pd.DataFrame()
         df = self._apply_ref_map(df, ref_col, id_col, ref_filename)
-        df["points"] = df["points"].fillna(0)
-        df["wins"] = df["wins"].fillna(0)
-        df.to_csv(f"{self.processed_path}{out_filename}", index=False)
+        df["points"] = df["points"].fillna(0).astype(_POINTS_DTYPE)
+        df = self._coerce_int_columns(df, ["wins"])
+        self._write_clean(df, out_filename)
         self.logger.info("Transformed %s %s.", len(df), filename)
         return df
 
@@ -313,16 +451,84 @@ class F1DataTransformer:
         )
         return df_const, df_driver
 
-    def transform_all(self) -> None:
+    @staticmethod
+    def _stamp(path: str | None) -> list | None:
+        """(name, size, mtime) of a file; a rewrite or a format switch changes it. None when missing."""
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return [os.path.basename(path), stat.st_size, stat.st_mtime_ns]
+
+    def _input_state(self) -> dict:
+        # The transform code is an input too: editing it must not leave stale tables in place.
+        code = [self._stamp(os.path.join(SCRIPT_DIR, name)) for name in ("transform_data.py", "table_io.py")]
+        return {
+            "version": 1,
+            "output_format": self.output_format,
+            "code": code,
+            "inputs": {name: self._stamp(find_table(self.raw_path, name)) for name in _RAW_TABLES},
+        }
+
+    def _output_stamps(self) -> dict:
+        return {name: self._stamp(find_table(self.processed_path, name)) for name in _CLEAN_TABLES}
+
+    def _is_up_to_date(self, state: dict) -> bool:
+        """True when the last run saw these exact inputs and its outputs are untouched since."""
+        try:
+            with open(os.path.join(self.processed_path, _STATE_FILE), "r") as handle:
+                saved = json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return False
+        outputs = saved.pop("outputs", None)
+        return saved == state and outputs == self._output_stamps()
+
+    def _save_state(self, state: dict) -> None:
+        path = os.path.join(self.processed_path, _STATE_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as handle:
+            json.dump({**state, "outputs": self._output_stamps()}, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def transform_all(self, force: bool = False) -> None:
+        """Run every transform; skipped when the raw tables are unchanged since the last run, unless ``force``."""
+        state = self._input_state()
+        if not force and self._is_up_to_date(state):
+            self.logger.info("Raw tables unchanged since the last transformation; skipping (use --force to rerun).")
+            return
+        state_path = os.path.join(self.processed_path, _STATE_FILE)
+        if os.path.exists(state_path):
+            # A run that fails part-way must not be mistaken for a finished one.
+            os.remove(state_path)
+        # The inputs changed, so nothing resolved from them on an earlier run can be reused.
+        self._ref_maps.clear()
+        self._raw_paths.clear()
+
         self.logger.info("Starting data transformation.")
         try:
-            self.transform_circuits()
-            self.transform_drivers()
-            self.transform_races()
-            self.transform_results()
-            self.transform_qualifying()
-            self.transform_pit_stops()
-            self.transform_standings()
+            # Scoped like the loader's: column edits copy lazily instead of per intermediate frame.
+            with pd.option_context("mode.copy_on_write", True):
+                # Every transform reads raw tables only, so they can run side by side; parsing and
+                # writing release the GIL. Ref maps are built up front so threads only read the cache.
+                for filename, ref_col, id_col in _REF_MAPS:
+                    try:
+                        self._load_ref_map(filename, ref_col, id_col)
+                    except (FileNotFoundError, KeyError):
+                        pass  # reported by the transform that needs it
+                steps = [
+                    self.transform_circuits,
+                    self.transform_drivers,
+                    self.transform_races,
+                    self.transform_results,
+                    self.transform_qualifying,
+                    self.transform_pit_stops,
+                    self.transform_standings,
+                ]
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    list(pool.map(lambda step: step(), steps))
+            self._save_state(state)
             self.logger.info("All transformations completed.")
             self.logger.info("Cleaned data written to: %s", self.processed_path)
         except Exception:
@@ -331,8 +537,18 @@ class F1DataTransformer:
 
 
 def main() -> None:
-    transformer = F1DataTransformer()
-    transformer.transform_all()
+    parser = argparse.ArgumentParser(description="Clean raw F1 tables for loading")
+    parser.add_argument(
+        "--format",
+        choices=TABLE_FORMATS,
+        default="parquet",
+        help="On-disk format for processed tables (default: parquet; csv for compatibility)",
+    )
+    parser.add_argument("--force", action="store_true", help="Rerun even if the raw tables are unchanged")
+    args = parser.parse_args()
+
+    transformer = F1DataTransformer(output_format=args.format)
+    transformer.transform_all(force=args.force)
 
 
 if __name__ == "__main__":
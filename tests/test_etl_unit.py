@@ -4,7 +4,7 @@ import tempfile
 import unittest
 
 import pandas as pd
-from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import inspect as sa_inspect, text
 
 from scripts.transform_data import F1DataTransformer
 from scripts.load_data import F1DataLoader
@@ -55,6 +55,138 @@ class TestTransformMissingFiles(unittest.TestCase):
             self.assertTrue(df.empty)
 
 
+class TestTableIO(unittest.TestCase):
+    def test_write_replaces_stale_format_and_counts_rows(self):
+        from scripts.table_io import count_rows, find_table, read_table, write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            write_csv(os.path.join(tmp, "races.csv"), ["race_id"], [[202401]])
+            df = pd.DataFrame({"race_id": [202401, 202402], "race_name": ["Bahrain", "Saudi"]})
+            write_table(df, tmp, "races", "parquet")
+            path = find_table(tmp, "races.csv")
+            self.assertTrue(path.endswith("races.parquet"))
+            self.assertFalse(os.path.exists(os.path.join(tmp, "races.csv")))
+            self.assertEqual(count_rows(path), 2)
+            pd.testing.assert_frame_equal(read_table(path), df)
+
+    def test_feather_roundtrip(self):
+        from scripts.table_io import count_rows, read_table, write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            df = pd.DataFrame({"year": [2023, 2024], "url": ["a", "b"]})
+            path = write_table(df, tmp, "seasons", "feather")
+            self.assertTrue(path.endswith("seasons.feather"))
+            self.assertEqual(count_rows(path), 2)
+            pd.testing.assert_frame_equal(read_table(path), df)
+
+    def test_streamed_batches_with_differing_categories(self):
+        from scripts.table_io import TableWriter, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            first = pd.DataFrame({"status": pd.Categorical(["Finished"]), "time": [None]})
+            second = pd.DataFrame({"status": pd.Categorical(["Brakes", "Finished"]), "time": ["1:30:00", None]})
+            for fmt in ("parquet", "feather", "csv"):
+                with TableWriter(tmp, "results", fmt, ["status", "time"]) as writer:
+                    writer.write(first)
+                    writer.write(second)
+                df = read_table(writer.path)
+                self.assertEqual(writer.rows, 3)
+                self.assertListEqual(df["status"].astype(str).tolist(), ["Finished", "Brakes", "Finished"])
+
+    def test_arrow_batches_are_written_without_pandas(self):
+        import pyarrow as pa
+        from scripts.table_io import TableWriter, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt in ("parquet", "feather", "csv"):
+                with TableWriter(tmp, "pit_stops", fmt, ["race_id", "milliseconds"]) as writer:
+                    writer.write(pa.table({"race_id": [202401], "milliseconds": [None]}))
+                    writer.write(pa.table({"race_id": [202402], "milliseconds": [21500]}))
+                df = read_table(writer.path)
+                self.assertListEqual(df["race_id"].tolist(), [202401, 202402])
+                self.assertEqual(df["milliseconds"].iloc[1], 21500)
+
+    def test_failed_stream_keeps_previous_file(self):
+        from scripts.table_io import TableWriter, count_rows, write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_table(pd.DataFrame({"race_id": [202401]}), tmp, "results", "parquet")
+            with self.assertRaises(RuntimeError):
+                with TableWriter(tmp, "results", "parquet", ["race_id"]) as writer:
+                    writer.write(pd.DataFrame({"race_id": [202402, 202403]}))
+                    raise RuntimeError("interrupted")
+            self.assertEqual(count_rows(path), 1)
+            self.assertFalse(os.path.exists(path + ".tmp"))
+
+    def test_column_projection(self):
+        from scripts.table_io import read_table, write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            df = pd.DataFrame({"race_id": [202401], "driver_id": [1], "status": ["Finished"]})
+            for fmt in ("parquet", "feather", "csv"):
+                path = write_table(df, tmp, "results", fmt)
+                projected = read_table(path, columns=["status", "race_id", "missing"])
+                self.assertListEqual(list(projected.columns), ["status", "race_id"])
+
+    def test_iter_table_chunks_every_format(self):
+        from scripts.table_io import iter_table, write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            df = pd.DataFrame({"race_id": range(5), "driver_id": range(5, 10), "status": list("abcde")})
+            for fmt in ("parquet", "feather", "csv"):
+                path = write_table(df, tmp, "results", fmt)
+                chunks = list(iter_table(path, 2, columns=["status", "race_id"]))
+                self.assertListEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+                pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df[["status", "race_id"]])
+
+    def test_csv_nullable_integers_stay_integers(self):
+        from scripts.table_io import read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.csv")
+            write_csv(path, ["race_id", "grid"], [[202401, 1], [202401, ""]])
+            df = read_table(path, csv_engine="pyarrow", dtype_backend="numpy_nullable")
+            self.assertEqual(str(df["grid"].dtype), "Int64")
+            self.assertTrue(pd.isna(df["grid"].iloc[1]))
+
+    def test_transformer_reads_parquet_raw_tables(self):
+        from scripts.table_io import write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            write_table(pd.DataFrame({"driver_id": [1], "driver_ref": ["max_verstappen"]}), tmp, "drivers", "parquet")
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
+            df = pd.DataFrame({"driver_ref": ["max_verstappen"]})
+            result = t._apply_ref_map(df, "driver_ref", "driver_id", "drivers.csv")
+            self.assertListEqual(result["driver_id"].tolist(), [1])
+
+    def test_ref_map_read_once_per_transformer(self):
+        from scripts.table_io import write_table
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_table(pd.DataFrame({"driver_id": [7], "driver_ref": ["perez"]}), tmp, "drivers", "parquet")
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
+            self.assertEqual(t._load_ref_map("drivers.csv", "driver_ref", "driver_id").to_dict(), {"perez": 7})
+            os.remove(path)
+            self.assertEqual(t._load_ref_map("drivers.csv", "driver_ref", "driver_id").to_dict(), {"perez": 7})
+
+    def test_transformer_writes_parquet_processed_tables(self):
+        from scripts.table_io import find_table, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            write_csv(os.path.join(tmp, "circuits.csv"),
+                      ["circuit_ref", "circuit_name", "location", "country", "lat", "lng", "altitude", "url"],
+                      [["monza", "Monza", "Monza", "Italy", 45.6, 9.28, "", ""]])
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/processed/")
+            t.transform_circuits()
+            path = find_table(tmp + "/processed/", "circuits_clean.csv")
+            self.assertTrue(path.endswith("circuits_clean.parquet"))
+            self.assertEqual(read_table(path)["circuit_ref"].tolist(), ["monza"])
+
+    def test_transform_all_skips_unchanged_inputs(self):
+        from unittest import mock
+        with tempfile.TemporaryDirectory() as tmp:
+            circuits = os.path.join(tmp, "circuits.csv")
+            columns = ["circuit_ref", "circuit_name", "location", "country", "lat", "lng", "altitude", "url"]
+            write_csv(circuits, columns, [["monza", "Monza", "Monza", "Italy", 45.6, 9.28, "", ""]])
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/processed/")
+            t.transform_all()
+            with mock.patch.object(t, "transform_circuits", wraps=t.transform_circuits) as spy:
+                t.transform_all()
+                spy.assert_not_called()
+                write_csv(circuits, columns, [["spa", "Spa", "Stavelot", "Belgium", 50.4, 5.97, "", ""]])
+                t.transform_all()
+                spy.assert_called_once()
+
+
 class TestApplyRefMap(unittest.TestCase):
     def test_unmapped_refs_are_dropped(self):
         with tempfile.TemporaryDirectory() as tmp:
@@ -93,6 +225,7 @@ class TestDNFSentinel(unittest.TestCase):
         self.assertEqual(DNF_POSITION_ORDER, 999)
 
     def test_non_finisher_gets_sentinel(self):
+        from scripts.table_io import find_table, read_table
         with tempfile.TemporaryDirectory() as tmp:
             write_csv(
                 os.path.join(tmp, "results.csv"),
@@ -109,9 +242,58 @@ class TestDNFSentinel(unittest.TestCase):
                       ["constructor_id", "constructor_ref"], [[9, "red_bull"]])
 
             t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
-            df = t.transform_results()
+            self.assertEqual(t.transform_results(), 1)
+            df = read_table(find_table(tmp, "results_clean"))
             self.assertEqual(df["position_order"].iloc[0], DNF_POSITION_ORDER)
 
+    def test_pit_stop_milliseconds_from_duration(self):
+        from scripts.table_io import find_table, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            write_csv(
+                os.path.join(tmp, "pit_stops.csv"),
+                ["race_id", "driver_ref", "stop", "lap", "duration", "milliseconds"],
+                [[202401, "max_verstappen", 1, 14, "1.001", ""],
+                 [202401, "max_verstappen", 2, 30, "22.5", 22480],
+                 [202401, "max_verstappen", 3, 45, "", ""]],
+            )
+            write_csv(os.path.join(tmp, "drivers.csv"),
+                      ["driver_id", "driver_ref"], [[1, "max_verstappen"]])
+
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
+            self.assertEqual(t.transform_pit_stops(), 3)
+            df = read_table(find_table(tmp, "pit_stops_clean"))
+            self.assertEqual(df["milliseconds"].tolist(), [1001, 22480, 0])
+
+    def test_raw_ids_skip_ref_maps(self):
+        from scripts.table_io import find_table, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            # No drivers/constructors files: the IDs in the raw table must be used as-is.
+            write_csv(
+                os.path.join(tmp, "qualifying.csv"),
+                ["race_id", "driver_id", "constructor_id", "number", "position", "q1"],
+                [[202401, 1, 9, 1, 1, "1:29.179"]],
+            )
+
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
+            t.transform_qualifying()
+            df = read_table(find_table(tmp, "qualifying_clean"))
+            self.assertEqual(df[["driver_id", "constructor_id"]].values.tolist(), [[1, 9]])
+
+    def test_qualifying_times_parsed_to_ms(self):
+        from scripts.table_io import find_table, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            write_csv(
+                os.path.join(tmp, "qualifying.csv"),
+                ["race_id", "driver_id", "constructor_id", "number", "position", "q1", "q2", "q3"],
+                [[202401, 1, 9, 1, 1, "1:29.179", "1:28.5", ""]],
+            )
+
+            t = F1DataTransformer(raw_data_path=tmp + "/", processed_data_path=tmp + "/")
+            t.transform_qualifying()
+            row = read_table(find_table(tmp, "qualifying_clean")).iloc[0]
+            self.assertEqual((row["q1"], row["q1_ms"], row["q2_ms"]), ("1:29.179", 89179, 88500))
+            self.assertTrue(pd.isna(row["q3_ms"]))
+
 
 class TestStrictSchema(unittest.TestCase):
     def test_strict_schema_controls_raise_behavior(self):
@@ -166,6 +348,222 @@ class TestNormalizeProgress(unittest.TestCase):
             self.assertNotIn("2021", result["years"])
 
 
+class TestFetchMany(unittest.TestCase):
+    def test_results_keep_endpoint_order(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/", max_workers=4)
+            e._make_request = lambda endpoint, limit=1000, offset=0: {"endpoint": endpoint}
+            endpoints = [f"2024/{r}/results" for r in range(1, 11)]
+            results = e._fetch_many(endpoints)
+            self.assertEqual([r["endpoint"] for r in results], endpoints)
+
+
+class TestExtractTable(unittest.TestCase):
+    def test_known_and_unknown_tables(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/")
+            data = {"MRData": {"CircuitTable": {"season": "2024", "Circuits": [{"circuitId": "monza"}]}}}
+            self.assertEqual(e._extract_table(data, "CircuitTable"), [{"circuitId": "monza"}])
+            other = {"MRData": {"StatusTable": {"Status": [{"statusId": "1"}]}}}
+            self.assertEqual(e._extract_table(other, "StatusTable"), [{"statusId": "1"}])
+            self.assertEqual(e._extract_table({}, "RaceTable"), [])
+
+
+class TestPaginate(unittest.TestCase):
+    def test_short_pages_from_capped_server_are_followed(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/")
+            drivers = [{"driverId": f"d{i}"} for i in range(250)]
+            offsets = []
+
+            def fake_request(endpoint, limit=1000, offset=0):
+                offsets.append(offset)
+                page = drivers[offset:offset + min(limit, 100)]
+                return {"MRData": {"total": "250", "DriverTable": {"Drivers": page}}}
+
+            e._make_request = fake_request
+            pages = list(e._paginate("drivers", "DriverTable"))
+            self.assertEqual(sum(len(p) for p in pages), 250)
+            self.assertEqual(offsets, [0, 100, 200])
+
+
+def _results_payload(year, rnd):
+    return {"MRData": {"total": "2", "RaceTable": {"Races": [{
+        "season": str(year), "round": str(rnd),
+        "Results": [
+            {"number": "1", "position": "1", "positionText": "1", "points": "25", "grid": "1", "laps": "57",
+             "status": "Finished", "Time": {"millis": "5400000", "time": "1:30:00"},
+             "Driver": {"driverId": "max_verstappen"}, "Constructor": {"constructorId": "red_bull"},
+             "FastestLap": {"rank": "1", "lap": "44", "Time": {"time": "1:32.6"}, "AverageSpeed": {"speed": "210.3"}}},
+            {"number": "11", "position": "", "positionText": "R", "points": "0", "grid": "0", "laps": "12",
+             "status": "Brakes", "Driver": {"driverId": "perez"}, "Constructor": {"constructorId": "red_bull"}},
+        ],
+    }]}}}
+
+
+class TestExtractResults(unittest.TestCase):
+    def test_rows_built_per_column(self):
+        from scripts.extract_data import F1DataExtractor, RESULT_COLUMNS
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/")
+            e._get_rounds_by_year = lambda start, end: {2024: [1, 2]}
+            e._fetch_many = lambda endpoints, limit=1000: [
+                _results_payload(2024, int(ep.split("/")[1])) for ep in endpoints
+            ]
+            from scripts.table_io import find_table, read_table
+            rows = e.extract_results(2024, 2024)
+            df = read_table(find_table(tmp + "/raw/", "results"))
+            self.assertEqual(rows, 4)
+            self.assertListEqual(list(df.columns), RESULT_COLUMNS)
+            self.assertListEqual(df["race_id"].tolist(), [202401, 202401, 202402, 202402])
+            dnf = df[df["driver_ref"] == "perez"].iloc[0]
+            self.assertTrue(pd.isna(dnf["position"]))
+            self.assertEqual(dnf["position_order"], DNF_POSITION_ORDER)
+            self.assertEqual(dnf["grid"], 0)
+            self.assertEqual(str(df["position"].dtype), "Int64")
+            self.assertIsInstance(df["status"].dtype, pd.CategoricalDtype)
+            self.assertEqual(df["points"].tolist(), [25.0, 0.0, 25.0, 0.0])
+
+    def test_resume_keeps_rows_of_finished_rounds(self):
+        from scripts.extract_data import F1DataExtractor
+        from scripts.table_io import find_table, read_table
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/")
+            fetched = []
+
+            def fake_fetch(endpoints, limit=1000):
+                fetched.extend(endpoints)
+                pages = [_results_payload(int(ep.split("/")[0]), int(ep.split("/")[1])) for ep in endpoints]
+                for page in pages:
+                    # Full grid, so the completeness check does not force a rebuild.
+                    page["MRData"]["RaceTable"]["Races"][0]["Results"] *= 5
+                return pages
+
+            e._fetch_many = fake_fetch
+            e._get_rounds_by_year = lambda start, end: {2023: [1], 2024: [1]}
+            e.extract_results(2023, 2024)
+            e._get_rounds_by_year = lambda start, end: {2023: [1], 2024: [1, 2]}
+            fetched.clear()
+            rows = e.extract_results(2023, 2024)
+            self.assertListEqual(fetched, ["2024/2/results"])
+            self.assertEqual(rows, 30)
+            df = read_table(find_table(tmp + "/raw/", "results"))
+            self.assertListEqual(sorted(set(df["race_id"])), [202301, 202401, 202402])
+
+
+class TestExtractStandings(unittest.TestCase):
+    def test_one_request_per_season_and_kind(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/", max_workers=4)
+            requested = []
+
+            def fake_request(endpoint, limit=1000, offset=0):
+                requested.append(endpoint)
+                year, kind = endpoint.split("/")
+                key, entity, ref = (("ConstructorStandings", "Constructor", "constructorId")
+                                    if kind == "constructorStandings" else ("DriverStandings", "Driver", "driverId"))
+                lists = [{"round": str(r), key: [{"points": str(10 * r), "position": "1", "positionText": "1",
+                                                  "wins": str(r), entity: {ref: "red_bull"}}]} for r in (1, 2)]
+                return {"MRData": {"total": "2", "StandingsTable": {"StandingsLists": lists}}}
+
+            e._make_request = fake_request
+            df_const, df_driver = e.extract_standings(2023, 2024)
+            self.assertEqual(sorted(requested), sorted(
+                f"{y}/{k}" for y in (2023, 2024) for k in ("constructorStandings", "driverStandings")
+            ))
+            self.assertListEqual(df_const["race_id"].tolist(), [202301, 202302, 202401, 202402])
+            self.assertEqual(len(df_driver), 4)
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class TestEtagRevalidation(unittest.TestCase):
+    def test_not_modified_serves_cached_page(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/", base_delay=0)
+            sent = []
+
+            def fake_get(url, timeout=None, headers=None):
+                sent.append(headers)
+                if headers and headers.get("If-None-Match") == '"v1"':
+                    return _FakeResponse(304)
+                return _FakeResponse(200, b'{"MRData": {"total": "1"}}', {"ETag": '"v1"'})
+
+            e.session.get = fake_get
+            first = e._make_request("seasons")
+            second = e._make_request("seasons")
+            self.assertIsNone(sent[0])
+            self.assertEqual(sent[1], {"If-None-Match": '"v1"'})
+            self.assertEqual(first, second)
+
+    def test_finished_season_served_from_disk(self):
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/", base_delay=0)
+            calls = []
+
+            def fake_get(url, timeout=None, headers=None):
+                calls.append(url)
+                return _FakeResponse(200, b'{"MRData": {"total": "1"}}')
+
+            e.session.get = fake_get
+            e._make_request("2021/1/results")
+            e._make_request("2021/1/results")
+            self.assertEqual(len(calls), 1)
+
+            e.use_cache = False
+            e._make_request("2021/1/results")
+            self.assertEqual(len(calls), 2)
+
+    def test_page_cached_mid_season_is_revalidated(self):
+        from datetime import datetime
+        from scripts.extract_data import F1DataExtractor
+        with tempfile.TemporaryDirectory() as tmp:
+            e = F1DataExtractor(output_path=tmp + "/raw/", base_delay=0)
+            sent = []
+
+            def fake_get(url, timeout=None, headers=None):
+                sent.append(headers)
+                if headers and headers.get("If-None-Match") == '"v1"':
+                    return _FakeResponse(304)
+                return _FakeResponse(200, b'{"MRData": {"total": "5"}}', {"ETag": '"v1"'})
+
+            e.session.get = fake_get
+            url = f"{e.BASE_URL}/2021/driverStandings.json?limit=1000&offset=0"
+            e._make_request("2021/driverStandings")
+            # Pretend the page was cached in June 2021, before the season ended.
+            mid_season = datetime(2021, 6, 1).timestamp()
+            os.utime(f"{e._page_cache_path(url)}.json.gz", (mid_season, mid_season))
+
+            e._make_request("2021/driverStandings")
+            self.assertEqual(sent[1], {"If-None-Match": '"v1"'})
+            # The 304 marks the page as fetched now, after its season: served from disk from then on.
+            e._make_request("2021/driverStandings")
+            self.assertEqual(len(sent), 2)
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_delta_seconds_and_http_date(self):
+        from scripts.extract_data import _parse_retry_after
+        self.assertEqual(_parse_retry_after("3"), 3.0)
+        self.assertEqual(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertIsNone(_parse_retry_after(None))
+
+
 class TestIncrementalStagingCleanup(unittest.TestCase):
     def test_staging_table_dropped_on_upsert_failure(self):
         """Staging table must not persist when the upsert fails."""
@@ -199,6 +597,51 @@ class TestIncrementalStagingCleanup(unittest.TestCase):
             self.assertTrue(os.path.exists(db_path + ".bak"),
                             "backup file should exist after full refresh of an existing DB")
 
+    def test_full_refresh_sqlite_bulk_insert(self):
+        """The raw executemany path stores NULLs and datetimes the way to_sql did."""
+        with tempfile.TemporaryDirectory() as tmp:
+            loader = F1DataLoader(
+                config={"type": "sqlite", "filename": os.path.join(tmp, "test.db")},
+                processed_data_path=tmp + "/",
+                mode="full_refresh",
+            )
+            df = pd.DataFrame({
+                "driver_id": [1, 2], "driver_ref": ["max_verstappen", "perez"],
+                "driver_number": [1, 11], "code": ["VER", "PER"],
+                "forename": ["Max", "Sergio"], "surname": ["Verstappen", "Perez"],
+                "dob": pd.to_datetime(["1997-09-30", None]),
+                "nationality": ["Dutch", "Mexican"], "url": ["", ""],
+            })
+            loader._load_table_full_refresh(df, "drivers")
+            loader._load_table_full_refresh(df, "drivers")
+            with loader.engine.connect() as conn:
+                rows = conn.execute(text("SELECT driver_id, dob FROM drivers ORDER BY driver_id")).fetchall()
+            self.assertEqual([tuple(r) for r in rows], [(1, "1997-09-30 00:00:00.000000"), (2, None)])
+
+    def test_full_refresh_rebuilds_indices(self):
+        """Indexes dropped for the bulk load are all back once load_all returns."""
+        with tempfile.TemporaryDirectory() as tmp:
+            loader = F1DataLoader(
+                config={"type": "sqlite", "filename": os.path.join(tmp, "test.db")},
+                processed_data_path=tmp + "/",
+                mode="full_refresh",
+            )
+            loader.load_all()
+            inspector = sa_inspect(loader.engine)
+            for table, indices in F1DataLoader.INDICES.items():
+                existing = {idx["name"] for idx in inspector.get_indexes(table)}
+                self.assertTrue({name for name, _ in indices} <= existing, table)
+
+    def test_categorical_string_columns_coerced(self):
+        """Categorical text columns (as written by extract/transform) with gaps coerce to ''."""
+        with tempfile.TemporaryDirectory() as tmp:
+            loader = F1DataLoader(
+                config={"type": "sqlite", "filename": os.path.join(tmp, "test.db")},
+                processed_data_path=tmp + "/",
+            )
+            df = pd.DataFrame({"status": pd.Categorical(["Finished", None])})
+            self.assertListEqual(loader._coerce_df(df, "results")["status"].tolist(), ["Finished", ""])
+
 
 class TestDatetimeCoercionLogging(unittest.TestCase):
     def test_invalid_dob_logged_not_silently_dropped(self):